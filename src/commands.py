@@ -7,13 +7,23 @@ Separates command routing from business logic.
 """
 
 import logging
+import time
 from typing import Optional
 
 from .gofile_client import GoFileClient
 from .db_manager import DatabaseManager
 from .file_manager import list_files
 from .services import DeletionService, CategoryService, UploadService
-from .utils import print_info, confirm_action, print_success, print_warning
+from .utils import (
+    print_info,
+    confirm_action,
+    print_success,
+    print_warning,
+    aggregate_stats,
+    format_size,
+    format_speed,
+    format_time,
+)
 
 logger = logging.getLogger("gofile_uploader")
 
@@ -133,7 +143,10 @@ def handle_remove_category_command(
         return  # User cancelled or no match
 
     # Remove the category
-    category_service.remove_category(category_name, deletion_service, force)
+    try:
+        category_service.remove_category(category_name, deletion_service, force)
+    finally:
+        deletion_service.close()
 
 
 def handle_upload_command(
@@ -198,35 +211,35 @@ def handle_upload_command(
                 f"New category '{category}' - will associate it with the upload folder"
             )
 
-    # Upload each file
-    new_category_folder_created = False
-    for file_path in final_files:
-        try:
-            upload_info = upload_service.upload_file(
-                file_path, folder_id, category, guest_account, quiet
-            )
+    # Upload the files
+    started = time.monotonic()
+    try:
+        results = upload_service.upload_files(
+            final_files, folder_id, category, guest_account, quiet
+        )
+    except KeyboardInterrupt:
+        logger.warning("Upload cancelled by user")
+        return
 
-            # Save guest account if we got a new token
-            if upload_info["guest_token"] and guest_account is None:
-                upload_service.save_guest_account(upload_info["guest_token"])
-                guest_account = upload_info["guest_token"]
-
-            # Handle category folder mapping for new categories
-            if not new_category_folder_created and category and not folder_id:
-                folder_id = upload_service.handle_category_folder(
-                    category,
-                    folder_id,
-                    upload_info["folder_id"],
-                    upload_info["folder_code"],
-                )
-                new_category_folder_created = True
-
-        except KeyboardInterrupt:
-            logger.warning(f"Upload of {file_path} cancelled by user")
-            return
-        except Exception as e:
-            # Error already logged in upload_service
-            continue
+    print_batch_summary(results, time.monotonic() - started)
+
+
+def print_batch_summary(results: list, elapsed: float) -> None:
+    """
+    Print the totals of a batch upload.
+
+    Args:
+        results: Upload result dictionaries returned by upload_files
+        elapsed: Wall-clock seconds the whole batch took
+    """
+    if len(results) > 1:
+        total_bytes, speed = aggregate_stats(
+            (r["file_size"] for r in results), elapsed
+        )
+        print_info(
+            f"Uploaded {len(results)} files, {format_size(total_bytes)} in "
+            f"{format_time(elapsed)} (average {format_speed(speed)})"
+        )
 
 
 def handle_import_token_command(db_manager: DatabaseManager, token: str) -> None:
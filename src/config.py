@@ -25,6 +25,12 @@ class Config:
         ),  # Path to database
         "max_log_size_mb": 5,
         "max_log_backups": 10,
+        "delete_workers": 16,  # Concurrent remote deletions in batch operations
+        "upload_workers": 4,  # Concurrent uploads when uploading multiple files
+        "treat_missing_as_deleted": False,  # Remove local records of files already gone from GoFile
+        "mpegts_ffprobe": False,  # Detect MPEG-TS files with ffprobe instead of reading the header
+        "upload_chunk_size_kb": 1024,  # Size of the first chunk read from a file while uploading
+        "upload_mmap": False,  # Memory-map files while uploading; truncating a file mid-upload then crashes
     }
 
     # Configuration file path
@@ -11,6 +11,42 @@ from src.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of IDs bound into a single "IN (...)" statement, kept well
+# below SQLite's host parameter limit
+BULK_DELETE_CHUNK_SIZE = 500
+
+# Connection settings: WAL journaling with NORMAL sync avoids an fsync per
+# write, and the larger cache/mmap keep lookups in memory
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=60000",
+)
+
+# Statements used on the hot paths. They are kept as constants so each call
+# passes the identical string and hits sqlite3's prepared statement cache
+INSERT_FILE_SQL = """
+    INSERT INTO files (
+        id, name, size, mime_type, upload_time, download_link,
+        folder_id, folder_code, category, account_id, upload_speed, upload_duration
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+DELETE_FILE_SQL = "DELETE FROM files WHERE id = ?"
+SELECT_FILES_SQL = """
+    SELECT id, name, size, mime_type, upload_time, download_link,
+           folder_id, folder_code, category, account_id, upload_speed, upload_duration
+    FROM files
+"""
+
+# Indexes on the columns used to look up files
+FILE_INDEXES = {
+    "idx_files_category": "files(category)",
+    "idx_files_name": "files(name)",
+}
+
 
 class DatabaseManager:
     """
@@ -30,7 +66,10 @@ class DatabaseManager:
             sys.exit(1)
 
         self.db_file = db_file
+        # Set while an explicit transaction opened by begin_transaction is active
+        self._in_transaction = False
         self.conn = self._initialize_db()
+        self.ensure_indexes()
 
     def _check_sqlite_available(self) -> bool:
         """
@@ -56,6 +95,9 @@ class DatabaseManager:
             conn = sqlite3.connect(self.db_file)
             cursor = conn.cursor()
 
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+
             # Create categories table if it doesn't exist
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS categories (
@@ -98,6 +140,59 @@ class DatabaseManager:
             logger.error(f"Error initializing database: {str(e)}")
             raise
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the file lookup indexes if they don't exist yet.
+
+        Databases created by older versions have no indexes, so they are added
+        here and the query planner statistics are refreshed once.
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            existing = {row[0] for row in cursor.fetchall()}
+
+            missing = [name for name in FILE_INDEXES if name not in existing]
+            for name in missing:
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {FILE_INDEXES[name]}"
+                )
+
+            if missing:
+                cursor.execute("ANALYZE")
+                self.conn.commit()
+                logger.debug(f"Created database indexes: {', '.join(missing)}")
+        except sqlite3.Error as e:
+            logger.error(f"Error creating database indexes: {str(e)}")
+
+    def begin_transaction(self) -> None:
+        """
+        Start an explicit write transaction.
+
+        Until commit() or rollback() is called, write methods no longer commit
+        on their own, so a batch of changes is written with a single commit.
+        """
+        if self.conn.in_transaction:
+            # Flush a pending implicit transaction before opening our own
+            self.conn.commit()
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._in_transaction = True
+
+    def commit(self) -> None:
+        """Commit the current transaction."""
+        self._in_transaction = False
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        """Roll back the current transaction."""
+        self._in_transaction = False
+        self.conn.rollback()
+
+    def _commit(self) -> None:
+        """Commit a single write unless an explicit transaction is active."""
+        if not self._in_transaction:
+            self.conn.commit()
+
     def get_folder_by_category(self, category: str) -> Optional[Dict[str, str]]:
         """
         Get folder information for a specific category.
@@ -160,7 +255,7 @@ class DatabaseManager:
                     folder_info.get("created_at", datetime.now().isoformat()),
                 ),
             )
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Saved folder information for category: {category}")
             return True
         except sqlite3.Error as e:
@@ -203,7 +298,7 @@ class DatabaseManager:
                 "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
                 ("guest_account", account_id),
             )
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Saved guest account ID: {account_id}")
             return True
         except sqlite3.Error as e:
@@ -220,7 +315,7 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM settings WHERE key = 'guest_account'")
-            self.conn.commit()
+            self._commit()
             if cursor.rowcount > 0:
                 logger.info("Cleared guest account token")
                 return True
@@ -244,7 +339,7 @@ class DatabaseManager:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM categories WHERE name = ?", (category,))
             if cursor.rowcount > 0:
-                self.conn.commit()
+                self._commit()
                 return True
             return False
         except sqlite3.Error as e:
@@ -319,12 +414,7 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO files (
-                    id, name, size, mime_type, upload_time, download_link, 
-                    folder_id, folder_code, category, account_id, upload_speed, upload_duration
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                INSERT_FILE_SQL,
                 (
                     file_info.get("id", ""),
                     file_info.get("name", ""),
@@ -340,7 +430,7 @@ class DatabaseManager:
                     file_info.get("upload_duration", 0.0),
                 ),
             )
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Saved file information for: {file_info.get('name')}")
             return True
         except sqlite3.Error as e:
@@ -374,6 +464,21 @@ class DatabaseManager:
         """
         return self._get_files_with_filter()
 
+    def get_orphaned_files(self) -> List[Dict[str, Union[str, int, float, None]]]:
+        """
+        Get all files whose category no longer exists.
+
+        Files are ordered by category, so they can be grouped in a single pass.
+
+        Returns:
+            List[Dict]: List of file information dictionaries, empty list if error or no files
+        """
+        return self._get_files_with_filter(
+            "category IS NOT NULL AND category != '' "
+            "AND category NOT IN (SELECT name FROM categories)",
+            order_by="category, upload_time DESC",
+        )
+
     def get_file_by_id(
         self, file_id: str
     ) -> Optional[Dict[str, Union[str, int, float, None]]]:
@@ -409,10 +514,10 @@ class DatabaseManager:
 
         try:
             cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            cursor.execute(DELETE_FILE_SQL, (file_id,))
 
             if cursor.rowcount > 0:
-                self.conn.commit()
+                self._commit()
                 logger.debug(f"Deleted file with ID: {file_id}")
                 return True
 
@@ -422,6 +527,41 @@ class DatabaseManager:
             logger.error(f"Error deleting file with ID {file_id}: {str(e)}")
             return False
 
+    def delete_files_bulk(self, file_ids: List[str]) -> int:
+        """
+        Delete multiple files from the database in a single transaction.
+
+        Args:
+            file_ids: IDs of the files to delete
+
+        Returns:
+            int: Number of files deleted, 0 if error or no files found
+        """
+        if not file_ids:
+            return 0
+
+        # Join a transaction the caller already opened instead of nesting one
+        owns_transaction = not self._in_transaction
+        try:
+            if owns_transaction:
+                self.begin_transaction()
+            cursor = self.conn.cursor()
+            deleted_count = 0
+            for start in range(0, len(file_ids), BULK_DELETE_CHUNK_SIZE):
+                chunk = file_ids[start : start + BULK_DELETE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"DELETE FROM files WHERE id IN ({placeholders})", chunk)
+                deleted_count += cursor.rowcount
+            if owns_transaction:
+                self.commit()
+            logger.debug(f"Deleted {deleted_count} files in bulk")
+            return deleted_count
+        except sqlite3.Error as e:
+            if owns_transaction:
+                self.rollback()
+            logger.error(f"Error deleting files in bulk: {str(e)}")
+            return 0
+
     def delete_files_by_category(self, category: str) -> int:
         """
         Delete all files associated with a specific category from the database.
@@ -442,7 +582,7 @@ class DatabaseManager:
             deleted_count = cursor.rowcount
 
             if deleted_count > 0:
-                self.conn.commit()
+                self._commit()
                 logger.info(
                     f"Deleted {deleted_count} files associated with category: {category}"
                 )
@@ -453,7 +593,10 @@ class DatabaseManager:
             return 0
 
     def _get_files_with_filter(
-        self, where_clause: Optional[str] = None, params: Optional[tuple] = None
+        self,
+        where_clause: Optional[str] = None,
+        params: Optional[tuple] = None,
+        order_by: str = "upload_time DESC",
     ) -> List[Dict[str, Union[str, int, float, None]]]:
         """
         Internal method to get files with optional filtering.
@@ -461,23 +604,18 @@ class DatabaseManager:
         Args:
             where_clause: Optional WHERE clause (without the WHERE keyword)
             params: Parameters for the WHERE clause
+            order_by: ORDER BY clause (without the ORDER BY keywords)
 
         Returns:
             List[Dict]: List of file information dictionaries
         """
         try:
             cursor = self.conn.cursor()
-            base_query = """
-                SELECT id, name, size, mime_type, upload_time, download_link, 
-                       folder_id, folder_code, category, account_id, upload_speed, upload_duration 
-                FROM files
-            """
-
             if where_clause:
-                query = f"{base_query} WHERE {where_clause} ORDER BY upload_time DESC"
+                query = f"{SELECT_FILES_SQL} WHERE {where_clause} ORDER BY {order_by}"
                 cursor.execute(query, params or ())
             else:
-                query = f"{base_query} ORDER BY upload_time DESC"
+                query = f"{SELECT_FILES_SQL} ORDER BY {order_by}"
                 cursor.execute(query)
 
             files = []
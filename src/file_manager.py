@@ -33,18 +33,20 @@ def find_file(db_manager, file_id_or_name):
     """
     file_to_delete = None
     serial_id = None
-    file_id = None
+
+    # First, try to find by direct ID match
+    file_to_delete = db_manager.get_file_by_id(file_id_or_name)
+    if file_to_delete:
+        return build_file_info(file_to_delete)
+
+    # Serial IDs and names need the full file list
     all_files = db_manager.get_all_files()
 
     # Add serial IDs to all files
     for i, file in enumerate(all_files):
         file["serial_id"] = i + 1
 
-    # First, try to find by direct ID match
-    file_to_delete = db_manager.get_file_by_id(file_id_or_name)
-    if file_to_delete:
-        file_id = file_id_or_name
-    elif file_id_or_name.isdigit():
+    if file_id_or_name.isdigit():
         # No direct ID match, check if it's a numeric serial ID
         serial_id = int(file_id_or_name)
 
@@ -117,9 +119,26 @@ def find_file(db_manager, file_id_or_name):
                     return None
 
     # At this point, we have found the file
+    return build_file_info(file_to_delete, serial_id)
+
+
+def build_file_info(file_data, serial_id=None):
+    """
+    Build the file info dictionary returned by find_file from a file record.
+
+    Batch operations that already hold the records use this directly, so they
+    don't have to look each file up again.
+
+    Args:
+        file_data: File data dictionary as returned by the database manager
+        serial_id: The file's serial ID, if it was found by serial ID
+
+    Returns:
+        dict: File info in the same shape as find_file returns
+    """
     # Get file details for display
-    actual_id = file_id or file_to_delete["id"]
-    name = file_to_delete["name"]
+    actual_id = file_data["id"]
+    name = file_data["name"]
 
     # Prepare info string
     info_str = f"✖ '{name}' (ID: {actual_id}"
@@ -127,12 +146,12 @@ def find_file(db_manager, file_id_or_name):
         info_str += f", Serial: {serial_id}"
     info_str += ")"
 
-    if "category" in file_to_delete and file_to_delete["category"]:
-        info_str += f" in category '{file_to_delete['category']}'"
+    if "category" in file_data and file_data["category"]:
+        info_str += f" in category '{file_data['category']}'"
 
     # Return all the information in a dictionary
     return {
-        "file_data": file_to_delete,
+        "file_data": file_data,
         "actual_id": actual_id,
         "name": name,
         "serial_id": serial_id,
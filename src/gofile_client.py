@@ -3,17 +3,28 @@
 GoFile.io API client.
 """
 
+import mmap
 import os
 import re
 import time
+import uuid
+from contextlib import contextmanager
 import requests
 import urllib.parse
-from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
-from typing import Dict, Any, Optional
-import mimetypes
-from src.utils import format_time, format_size, format_speed, BLUE, END
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from typing import Callable, Dict, Any, Iterator, Optional, Union, BinaryIO
+from src.utils import (
+    format_time,
+    format_size,
+    format_speed,
+    get_mime_type,
+    create_progress_bar,
+    BLUE,
+    END,
+)
 from src.logging_utils import get_logger
+from src.config import config
 
 logger = get_logger(__name__)
 
@@ -22,6 +33,173 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 2  # seconds
 DEFAULT_TIMEOUT = 30  # seconds for API calls (not uploads)
 
+# Connection pool sizing, so concurrent API calls reuse keep-alive connections
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 64
+
+# Default bytes read from the upload file per chunk sent to the socket,
+# overridable with the upload_chunk_size_kb config key
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+# Chunks double while the socket takes them quickly, up to this size, and
+# halve back towards the starting size when sending one becomes slow
+MAX_UPLOAD_BLOCK_SIZE = 16 * 1024 * 1024
+CHUNK_GROW_SECONDS = 0.25
+CHUNK_SHRINK_SECONDS = 2.0
+
+# Minimum seconds between progress bar updates during an upload
+PROGRESS_UPDATE_INTERVAL = 0.2
+# Seconds into an upload before a speed is shown; earlier readings are noise
+SPEED_WARMUP_SECONDS = 0.5
+
+
+def _quote_param(value: str) -> str:
+    """Escape a multipart header parameter the way browsers do."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartStream:
+    """
+    multipart/form-data request body that streams a file in large chunks.
+
+    requests sends any iterable with a length as a Content-Length framed
+    body, so the file is read in large chunks and handed to the socket
+    without an encoder wrapping every read. Files that support readinto
+    are read into one reused buffer, so each chunk is only valid until the
+    next one is requested. The chunk size adapts to how quickly chunks are
+    taken, between chunk_size and MAX_UPLOAD_BLOCK_SIZE.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_name: str,
+        file_obj: BinaryIO,
+        file_size: int,
+        mime_type: str,
+        callback: Optional[Callable[[int], None]] = None,
+        chunk_size: int = UPLOAD_BLOCK_SIZE,
+    ):
+        """
+        Build the multipart framing around a file.
+
+        Args:
+            fields: Plain form fields sent before the file
+            file_name: File name reported to the server
+            file_obj: Readable file positioned at the start
+            file_size: File size in bytes
+            mime_type: MIME type of the file
+            callback: Called with the number of file bytes sent so far
+            chunk_size: Bytes read from the file for the first chunk
+        """
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+            f"\r\n\r\n{value}\r\n"
+            for name, value in fields.items()
+        ]
+        parts.append(
+            f"--{boundary}\r\nContent-Disposition: form-data; "
+            f'name="file"; filename="{_quote_param(file_name)}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        )
+        self._preamble = "".join(parts).encode("utf-8")
+        self._epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._file_obj = file_obj
+        self._file_size = file_size
+        self._callback = callback
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return len(self._preamble) + self._file_size + len(self._epilogue)
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        yield self._preamble
+        read = self._file_obj.read
+        readinto = getattr(self._file_obj, "readinto", None)
+        callback = self._callback
+        min_chunk_size = chunk_size = self._chunk_size
+        max_chunk_size = max(chunk_size, MAX_UPLOAD_BLOCK_SIZE)
+        monotonic = time.monotonic
+        buffer = memoryview(b"")
+        sent = 0
+        remaining = self._file_size
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            if readinto is None:
+                chunk = read(size)
+                n = len(chunk)
+            else:
+                if size > len(buffer):
+                    buffer = memoryview(bytearray(size))
+                n = readinto(buffer[:size])
+                chunk = buffer[:n]
+            if not n:
+                raise OSError("File shrank while it was being uploaded")
+            # The generator resumes once the chunk has been sent, so the
+            # time spent suspended is the time the socket took to accept it
+            started = monotonic()
+            yield chunk
+            took = monotonic() - started
+            if took < CHUNK_GROW_SECONDS:
+                chunk_size = min(chunk_size * 2, max_chunk_size)
+            elif took > CHUNK_SHRINK_SECONDS:
+                chunk_size = max(chunk_size // 2, min_chunk_size)
+            sent += n
+            remaining -= n
+            if callback is not None:
+                callback(sent)
+        yield self._epilogue
+
+
+@contextmanager
+def open_upload_body(
+    file_path: str,
+    file_size: int,
+    buffer_size: int = UPLOAD_BLOCK_SIZE,
+    use_mmap: bool = False,
+) -> Iterator[Union[mmap.mmap, BinaryIO]]:
+    """
+    Open a file for upload.
+
+    The file is read through a regular file object by default. With use_mmap
+    it is memory-mapped instead, so reads come straight from the page cache,
+    but the process is killed with SIGBUS if the file is truncated while it
+    is being uploaded. Empty files and files that can't be mapped fall back
+    to the regular file object.
+
+    Args:
+        file_path: Path to the file
+        file_size: File size in bytes
+        buffer_size: Read buffer size when the file is not mapped
+        use_mmap: Whether to memory-map the file
+
+    Yields:
+        A readable object positioned at the start of the file
+    """
+    with open(file_path, "rb", buffering=buffer_size) as file_obj:
+        mm = None
+        if use_mmap and file_size > 0:
+            try:
+                mm = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Could not map {file_path}, reading it instead: {e}")
+        if mm is None:
+            if file_size > 0 and hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass  # only a readahead hint
+            yield file_obj
+            return
+        try:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+        finally:
+            mm.close()
+
 
 class GoFileClient:
     """GoFile.io API client for uploading files and managing folders."""
@@ -45,12 +223,40 @@ class GoFileClient:
             retry_delay: Delay in seconds between retry attempts
             timeout: Timeout in seconds for API calls (not uploads)
         """
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.account_token = account_token
         self._current_server = None
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.upload_chunk_size = (
+            max(1, int(config.get("upload_chunk_size_kb", UPLOAD_BLOCK_SIZE // 1024)))
+            * 1024
+        )
+        self.upload_mmap = bool(config.get("upload_mmap", False))
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create an HTTP session with a pooled HTTPS adapter.
+
+        Retries are left to upload_file's own loop, so the adapter does not
+        add transport-level retries on top of it.
+
+        Returns:
+            requests.Session: The configured session
+        """
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
 
     def get_server(self) -> str:
         """
@@ -201,7 +407,11 @@ class GoFileClient:
         return False
 
     def upload_file(
-        self, file_path: str, folder_id: Optional[str] = None
+        self,
+        file_path: str,
+        folder_id: Optional[str] = None,
+        file_size: Optional[int] = None,
+        position: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Upload a file to GoFile.io with automatic retry on transient failures.
@@ -209,6 +419,9 @@ class GoFileClient:
         Args:
             file_path: Path to the file to upload
             folder_id: Optional folder ID to upload to (creates new folder if None)
+            file_size: File size in bytes if the caller already knows it
+            position: Terminal line for the progress bar when several uploads
+                run at once
 
         Returns:
             Dict[str, Any]: The response data containing the download link
@@ -217,9 +430,13 @@ class GoFileClient:
             FileNotFoundError: If the file does not exist
             Exception: If upload fails after all retries
         """
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if file_size is None:
+            # One stat both checks the file exists and gets its size
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                logger.error(f"File not found: {file_path}")
+                raise FileNotFoundError(f"File not found: {file_path}")
 
         url = self.GLOBAL_UPLOAD_URL
         original_file_name = os.path.basename(file_path)
@@ -229,7 +446,9 @@ class GoFileClient:
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                return self._perform_upload(file_path, file_name, url, folder_id)
+                return self._perform_upload(
+                    file_path, file_name, file_size, url, folder_id, position
+                )
             except KeyboardInterrupt:
                 # Don't retry on user interrupt
                 raise
@@ -258,13 +477,18 @@ class GoFileClient:
         raise Exception("Upload failed after all retries")
 
     def _perform_upload(
-        self, file_path: str, file_name: str, url: str, folder_id: Optional[str]
+        self,
+        file_path: str,
+        file_name: str,
+        file_size: int,
+        url: str,
+        folder_id: Optional[str],
+        position: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Internal method to perform the actual upload with progress tracking.
         """
-        file_size = os.path.getsize(file_path)
-        start_time = time.time()
+        start_time = time.monotonic()
 
         form_data = {}
         if self.account_token:
@@ -272,48 +496,58 @@ class GoFileClient:
         if folder_id:
             form_data["folderId"] = folder_id
 
-        mime_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        mime_type = get_mime_type(file_name)
         logger.debug(f"Using MIME type {mime_type} for file {file_name}")
 
-        with open(file_path, "rb") as file_obj:
-            encoder = MultipartEncoder(
-                fields={**form_data, "file": (file_name, file_obj, mime_type)}
-            )
-
-            with tqdm(
-                total=file_size,
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
-                desc=f"↑ {file_name}",
-                bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]{postfix}",
+        chunk_size = self.upload_chunk_size
+        with open_upload_body(
+            file_path, file_size, chunk_size, self.upload_mmap
+        ) as body:
+            with create_progress_bar(
+                file_path, desc=file_name, file_size=file_size, position=position
             ) as pbar:
-                last_bytes = [0]
-
-                def on_progress(monitor):
-                    delta = monitor.bytes_read - last_bytes[0]
-                    if delta > 0:
-                        pbar.update(delta)
-                        last_bytes[0] = monitor.bytes_read
-                        elapsed = time.time() - start_time
-                        if elapsed > 0:
-                            pbar.set_postfix_str(
-                                format_speed(monitor.bytes_read / elapsed)
-                            )
-
-                monitor = MultipartEncoderMonitor(encoder, on_progress)
+                last_bytes = 0
+                last_update = 0.0
+
+                def on_progress(bytes_read):
+                    nonlocal last_bytes, last_update
+                    # The callback fires per chunk; the bar only needs to
+                    # hear about it a few times per second. Whatever is left
+                    # is added once the upload finishes
+                    now = time.monotonic()
+                    if now - last_update < PROGRESS_UPDATE_INTERVAL:
+                        return
+                    last_update = now
+                    pbar.update(bytes_read - last_bytes)
+                    last_bytes = bytes_read
+                    elapsed = now - start_time
+                    if elapsed > SPEED_WARMUP_SECONDS:
+                        pbar.set_postfix_str(format_speed(bytes_read / elapsed))
+
+                stream = MultipartStream(
+                    form_data,
+                    file_name,
+                    body,
+                    file_size,
+                    mime_type,
+                    # A disabled bar (output is not a terminal) needs no updates
+                    None if pbar.disable else on_progress,
+                    chunk_size,
+                )
 
                 response = self.session.post(
                     url,
-                    data=monitor,
-                    headers={"Content-Type": monitor.content_type},
+                    data=stream,
+                    headers={"Content-Type": stream.content_type},
                 )
                 response.raise_for_status()
 
-                if pbar.n < file_size:
-                    pbar.update(file_size - pbar.n)
+                # Only top up the bar for bytes the throttled callback skipped
+                remaining = file_size - pbar.n
+                if remaining > 0 and not pbar.disable:
+                    pbar.update(remaining)
 
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         speed = file_size / elapsed_time if elapsed_time > 0 else 0
         data = response.json()
 
@@ -329,11 +563,12 @@ class GoFileClient:
 
         file_size_fmt = format_size(file_size)
         speed_fmt = format_speed(speed)
-        print(
+        # tqdm.write keeps these lines from tearing the bars of other uploads
+        tqdm.write(
             f"Successfully uploaded {file_name} ({file_size_fmt}) in "
-            f"{format_time(elapsed_time)} at {speed_fmt}"
+            f"{format_time(elapsed_time)} at {speed_fmt}\n"
+            f"Download link: {BLUE}{download_page}{END}"
         )
-        print(f"Download link: {BLUE}{download_page}{END}")
 
         response_data["file_id"] = file_id
         response_data["folder_id"] = returned_folder_id
@@ -388,6 +623,7 @@ class GoFileClient:
             bool: True if deletion was successful, False otherwise
 
         Raises:
+            requests.exceptions.HTTPError: If the content does not exist (404)
             Exception: If the API call fails or unauthorized
         """
         if not self.account_token:
@@ -425,7 +661,11 @@ class GoFileClient:
             except ValueError:
                 error_message = str(e)
 
-            if status_code == 401 or status_code == 403:
+            if status_code == 404:
+                # Keep the HTTPError so callers can tell missing content apart
+                logger.error(f"Content not found on server: {error_message}")
+                raise
+            elif status_code == 401 or status_code == 403:
                 logger.error(f"Unauthorized to delete this content: {error_message}")
                 raise Exception(f"Unauthorized to delete this content: {error_message}")
             else:
@@ -9,20 +9,24 @@ Supports categorizing files and uploading to specific folders.
 
 import os
 import sys
-import json
-import mimetypes
+import time
 import argparse
 from requests.exceptions import HTTPError
-import glob
 import shutil
-from datetime import datetime, timedelta
+from itertools import groupby
+from src.commands import print_batch_summary
 from src.gofile_client import GoFileClient
 from src.db_manager import DatabaseManager
 from src.logging_utils import setup_logging, get_logger
 from src.config import config
-from src.file_manager import find_file, delete_file_from_db, list_files
+from src.services import DeletionService, UploadService
+from src.file_manager import (
+    find_file,
+    build_file_info,
+    delete_file_from_db,
+    list_files,
+)
 from src.utils import (
-    is_mpegts_file,
     DAYS,
     BLUE,
     END,
@@ -32,8 +36,8 @@ from src.utils import (
     print_operation_header,
     print_file_list_summary,
     print_confirmation_message,
+    format_size,
 )
-from .utils import DAYS
 from . import __version__
 
 logger = get_logger(__name__)
@@ -42,8 +46,6 @@ EXIT_SUCCESS = 0
 EXIT_ERROR = 1
 EXIT_USAGE = 2
 
-__version__ = "0.1.0"
-
 
 def handle_file_deletion(db_manager, file_id_or_name, force=False, auto_confirm=False):
     """
@@ -67,9 +69,24 @@ def handle_file_deletion(db_manager, file_id_or_name, force=False, auto_confirm=
         # File not found (find_file already printed an error message)
         return False
 
+    return delete_file_with_info(db_manager, file_info, force, auto_confirm)
+
+
+def delete_file_with_info(db_manager, file_info, force=False, auto_confirm=False):
+    """
+    Delete an already located file from GoFile server and local database.
+
+    Args:
+        db_manager: The database manager instance
+        file_info: File info as returned by find_file or build_file_info
+        force: If True, only delete from local database without attempting remote deletion
+        auto_confirm: If True, skip user confirmation prompts
+
+    Returns:
+        bool: True if deletion was successful, False otherwise
+    """
     logger.warning(file_info["info_str"])
 
-    file_data = file_info["file_data"]
     actual_id = file_info["actual_id"]
     name = file_info["name"]
 
@@ -86,65 +103,82 @@ def handle_file_deletion(db_manager, file_id_or_name, force=False, auto_confirm=
             logger.info("Deletion cancelled.")
             return False
 
-        download_link = ""
-        account_id = ""
-        try:
-            download_link = file_data.get("download_link", "")
-            account_id = file_data.get("account_id", "")
+        if not delete_file_remote(file_info):
+            return False
+        if delete_file_from_db(db_manager, actual_id):
+            logger.info(f"File '{name}' successfully deleted from local database.")
+            return True
+        logger.error(
+            "File was deleted from GoFile server but could not be removed from local database."
+        )
+        return False
 
-            if not account_id:
-                logger.error(
-                    f"No account token found for file '{name}'. Cannot delete from GoFile server."
-                )
-                logger.info("Use -f/--force to delete just the local database entry.")
-                return False
-
-            client = GoFileClient(account_token=account_id)
-
-            remote_delete_success = client.delete_contents(actual_id)
-
-            if remote_delete_success:
-                logger.info(f"File '{name}' successfully deleted from GoFile server.")
-                if delete_file_from_db(db_manager, actual_id):
-                    logger.info(
-                        f"File '{name}' successfully deleted from local database."
-                    )
-                    return True
-                else:
-                    logger.error(
-                        "File was deleted from GoFile server but could not be removed from local database."
-                    )
-                    return False
-            else:
-                logger.error(f"Failed to delete file '{name}' from GoFile server.")
-                if download_link:
-                    logger.error(
-                        f"You may need to check its status manually via your browser at: {download_link}"
-                    )
-                return False
-
-        except HTTPError as e:
+
+def delete_file_remote(file_info):
+    """
+    Delete an already located file from the GoFile server only.
+
+    The local database is left untouched, so batch callers can remove the
+    records of every deleted file in one short transaction afterwards.
+
+    Args:
+        file_info: File info as returned by find_file or build_file_info
+
+    Returns:
+        bool: True if the file was deleted from the GoFile server, False otherwise
+    """
+    file_data = file_info["file_data"]
+    actual_id = file_info["actual_id"]
+    name = file_info["name"]
+
+    download_link = ""
+    account_id = ""
+    try:
+        download_link = file_data.get("download_link", "")
+        account_id = file_data.get("account_id", "")
+
+        if not account_id:
             logger.error(
-                f"HTTP error deleting file '{name}' from GoFile server: {str(e)}"
+                f"No account token found for file '{name}'. Cannot delete from GoFile server."
             )
-            if e.response is not None:
-                logger.error(
-                    f"Status Code: {e.response.status_code}. Message: {e.response.text}"
-                )
-            if download_link:
-                logger.error(
-                    f"This may be because the file doesn't exist on the server.\nPlease check its status or via your browser: {download_link}"
-                )
+            logger.info("Use -f/--force to delete just the local database entry.")
             return False
-        except Exception as e:
+
+        client = GoFileClient(account_token=account_id)
+
+        remote_delete_success = client.delete_contents(actual_id)
+
+        if remote_delete_success:
+            logger.info(f"File '{name}' successfully deleted from GoFile server.")
+            return True
+
+        logger.error(f"Failed to delete file '{name}' from GoFile server.")
+        if download_link:
             logger.error(
-                f"Unexpected error deleting file '{name}' from GoFile server: {str(e)}"
+                f"You may need to check its status manually via your browser at: {download_link}"
             )
-            if download_link:
-                logger.error(
-                    f"You may need to check its status manually via your browser at: {download_link}"
-                )
-            return False
+        return False
+
+    except HTTPError as e:
+        logger.error(f"HTTP error deleting file '{name}' from GoFile server: {str(e)}")
+        if e.response is not None:
+            logger.error(
+                f"Status Code: {e.response.status_code}. Message: {e.response.text}"
+            )
+        if download_link:
+            logger.error(
+                f"This may be because the file doesn't exist on the server.\nPlease check its status or via your browser: {download_link}"
+            )
+        return False
+    except Exception as e:
+        logger.error(
+            f"Unexpected error deleting file '{name}' from GoFile server: {str(e)}"
+        )
+        if download_link:
+            logger.error(
+                f"You may need to check its status manually via your browser at: {download_link}"
+            )
+        return False
 
 
 def list_categories(db_manager):
@@ -171,39 +205,31 @@ def list_categories(db_manager):
         folder_code = category["folder_code"]
 
         if folder_code:
-            folder_link = f"{BLUE}https://gofile.io/d/{folder_code}{END}"
+            folder_url = f"https://gofile.io/d/{folder_code}"
+            folder_link = f"{BLUE}{folder_url}{END}"
         else:
-            folder_link = "<No folder link>"
+            folder_url = folder_link = "<No folder link>"
 
-        entry_width = max(len(name), len(folder_link) - len(BLUE) - len(END)) + 4
+        entry_width = max(len(name), len(folder_url)) + 4
         max_width = max(max_width, entry_width)
 
-        formatted_entries.append((name, folder_link))
+        # Keep the visible link length so padding ignores the color codes
+        formatted_entries.append((name, folder_link, len(folder_url)))
 
     num_cols = max(1, term_width // max_width)
 
     num_rows = (len(formatted_entries) + num_cols - 1) // num_cols
 
     for row in range(num_rows):
-        name_line = ""
-        for col in range(num_cols):
-            idx = col * num_rows + row
-            if idx < len(formatted_entries):
-                name = formatted_entries[idx][0]
-                name_line += f"{name:{max_width}}"
-        print(name_line)
-
-        url_line = ""
-        for col in range(num_cols):
-            idx = col * num_rows + row
-            if idx < len(formatted_entries):
-                url = formatted_entries[idx][1]
-                raw_length = (
-                    len(url) - len(BLUE) - len(END) if BLUE in url else len(url)
-                )
-                padding = max_width - raw_length
-                url_line += url + " " * padding
-        print(url_line)
+        # Entries are laid out column-major, so a row is every num_rows-th entry
+        row_entries = formatted_entries[row::num_rows]
+        print("".join(f"{name:<{max_width}}" for name, _, _ in row_entries))
+        print(
+            "".join(
+                link + " " * (max_width - link_width)
+                for _, link, link_width in row_entries
+            )
+        )
 
 
 def purge_category_files(db_manager, category_pattern, force=False):
@@ -236,24 +262,17 @@ def purge_category_files(db_manager, category_pattern, force=False):
         logger.info("Purge cancelled.")
         return False
 
-    deleted_count = 0
-    failed_count = 0
     print_operation_header(
         "Deleting", file_count, "files from category '" + category_name + "'"
     )
 
-    for file in files:
-        file_id = file["id"]
-
-        try:
-            result = handle_file_deletion(db_manager, file_id, force, auto_confirm=True)
-            if result:
-                deleted_count += 1
-            else:
-                failed_count += 1
-        except Exception as e:
-            logger.error(f"Error deleting file {file_id}: {str(e)}")
-            failed_count += 1
+    # Remote deletions run concurrently; the records of deleted files are then
+    # removed in one short transaction, also on Ctrl+C
+    deletion_service = DeletionService(db_manager)
+    try:
+        deleted_count, failed_count = deletion_service.delete_file_batch(files, force)
+    finally:
+        deletion_service.close()
 
     print_file_count_summary(deleted_count, failed_count, "deleted")
     return deleted_count > 0
@@ -266,13 +285,7 @@ def clear_orphaned_files(db_manager, force=False):
         db_manager: The database manager instance
         force: If True, only delete from local database without attempting remote deletion
     """
-    all_files = db_manager.get_all_files()
-    categories = set(db_manager.list_categories())
-
-    orphaned_files = []
-    for file in all_files:
-        if file["category"] and file["category"] not in categories:
-            orphaned_files.append(file)
+    orphaned_files = db_manager.get_orphaned_files()
 
     if not orphaned_files:
         logger.info("No orphaned files found.")
@@ -292,46 +305,32 @@ def clear_orphaned_files(db_manager, force=False):
         logger.info("Cleanup cancelled.")
         return False
 
-    deleted_count = 0
-    failed_count = 0
     print_operation_header("Deleting", len(orphaned_files), "orphaned files")
 
-    # Group by category for organized output
-    files_by_category = {}
-    for file in orphaned_files:
-        category = file["category"]
-        if category not in files_by_category:
-            files_by_category[category] = []
-        files_by_category[category].append(file)
-
-    for category, files in files_by_category.items():
-        print_operation_header(
-            "Processing", len(files), f"files from orphaned category '{category}'"
-        )
-        category_success = 0
-        category_failed = 0
-
-        for file in files:
-            file_id = file["id"]
+    deleted_count = 0
+    failed_count = 0
+    # One deletion service for all categories, so its clients keep their
+    # pooled connections until the end
+    deletion_service = DeletionService(db_manager)
+    try:
+        # Orphaned files come sorted by category
+        for category, group in groupby(orphaned_files, key=lambda f: f["category"]):
+            files = list(group)
+            print_operation_header(
+                "Processing", len(files), f"files from orphaned category '{category}'"
+            )
 
-            try:
-                result = handle_file_deletion(
-                    db_manager, file_id, force, auto_confirm=True
-                )
-                if result:
-                    deleted_count += 1
-                    category_success += 1
-                else:
-                    failed_count += 1
-                    category_failed += 1
-            except Exception as e:
-                logger.error(f"Error deleting file {file_id}: {str(e)}")
-                failed_count += 1
-                category_failed += 1
+            category_success, category_failed = deletion_service.delete_file_batch(
+                files, force
+            )
+            deleted_count += category_success
+            failed_count += category_failed
 
-        logger.info(
-            f"Completed: {category_success} deleted, {category_failed} failed for category '{category}'"
-        )
+            logger.info(
+                f"Completed: {category_success} deleted, {category_failed} failed for category '{category}'"
+            )
+    finally:
+        deletion_service.close()
 
     # Print summary
     print_file_count_summary(deleted_count, failed_count, "removed")
@@ -384,8 +383,8 @@ def remove_category(db_manager, category_pattern, force=False):
                     file_id = file["id"]
 
                     try:
-                        result = handle_file_deletion(
-                            db_manager, file_id, force, auto_confirm=True
+                        result = delete_file_with_info(
+                            db_manager, build_file_info(file), force, auto_confirm=True
                         )
                         if result:
                             deleted_count += 1
@@ -603,22 +602,14 @@ def main():
         parser.print_help()
         return EXIT_USAGE
 
-    expanded_files = []
-    for pattern in args.files:
-        if any(char in pattern for char in ["*", "?", "["]):
-            safe_pattern = glob.escape(pattern)
-            matched_files = glob.glob(safe_pattern)
-            if not matched_files:
-                logger.warning(f"Warning: No files found matching pattern: {pattern}")
-                continue
-            expanded_files.extend(matched_files)
-        else:
-            if os.path.exists(pattern):
-                expanded_files.append(pattern)
-            else:
-                logger.warning(f"Warning: File not found: {pattern}")
+    guest_account = db_manager.get_guest_account()
 
-    if not expanded_files:
+    client = GoFileClient(account_token=guest_account)
+    upload_service = UploadService(db_manager, client)
+
+    final_files = upload_service.prepare_files(args.files, args.recursive)
+
+    if not final_files:
         logger.info("No valid files found to upload.")
         return
 
@@ -629,34 +620,6 @@ def main():
         args.category = resolved_category
         logger.info(f"Uploading to category: {args.category}")
 
-    final_files = []
-    for file_path in expanded_files:
-        if os.path.isdir(file_path):
-            if args.recursive:
-                logger.info(f"Recursively processing directory: {file_path}")
-                for root, _, files in os.walk(file_path):
-                    for filename in files:
-                        final_files.append(os.path.join(root, filename))
-                logger.info(
-                    f"Added {len(final_files)} files from directory {file_path}"
-                )
-            else:
-                logger.info(
-                    f"No files found in directory {file_path} (use -r flag to upload directories recursively)"
-                )
-        else:
-            final_files.append(file_path)
-
-    if not final_files:
-        logger.info("No valid files found to upload after directory processing.")
-        return
-
-    args.files = final_files
-
-    guest_account = db_manager.get_guest_account()
-
-    client = GoFileClient(account_token=guest_account)
-
     folder_id = None
     if args.category:
         folder_info = db_manager.get_folder_by_category(args.category)
@@ -672,15 +635,12 @@ def main():
             )
 
     if args.dry_run:
-        from src.utils import format_size
-
         logger.info("=== DRY RUN MODE ===")
-        logger.info(f"Would upload {len(args.files)} file(s):")
+        logger.info(f"Would upload {len(final_files)} file(s):")
         total_size = 0
-        for file_path in args.files:
-            file_size = os.path.getsize(file_path)
-            total_size += file_size
-            logger.info(f"  - {os.path.basename(file_path)} ({format_size(file_size)})")
+        for job in final_files:
+            total_size += job.size
+            logger.info(f"  - {os.path.basename(job.path)} ({format_size(job.size)})")
         logger.info(f"Total size: {format_size(total_size)}")
         if args.category:
             logger.info(f"Category: {args.category}")
@@ -694,193 +654,26 @@ def main():
             logger.info("New guest account will be created")
         return EXIT_SUCCESS
 
-    new_category_folder_created = False
-    files_to_upload = args.files.copy()
-
-    skipped_files = []
-    for i, file_path in enumerate(args.files):
-        if is_mpegts_file(file_path):
-            logger.warning(
-                f"'{os.path.basename(file_path)}' appears to be an MPEG-TS (.ts) file."
-            )
-            logger.warning(
-                "These files may not play correctly in browsers when shared via GoFile."
-            )
-            if not confirm_action(
-                "Do you still want to upload this file? (yes/no):", require_yes=False
-            ):
-                logger.info(f"Skipping '{os.path.basename(file_path)}'")
-                skipped_files.append(file_path)
-                logger.info(f"Skipping MPEG-TS file: {file_path} based on user request")
-
-    for file_path in skipped_files:
-        files_to_upload.remove(file_path)
-
-    for file_path in files_to_upload:
-        try:
-            start_time = datetime.now()
-            response_data = client.upload_file(file_path, folder_id=folder_id)
-            duration_seconds = (datetime.now() - start_time).total_seconds()
-            if "data" in response_data and isinstance(response_data["data"], dict):
-                response_detail = response_data["data"]
-            else:
-                response_detail = response_data
-
-            logger.debug(f"Full response: {response_data}")
+    files_to_upload = upload_service.check_mpegts_files(final_files)
 
-            download_link = (
-                response_detail.get("downloadPage")
-                or response_detail.get("directLink")
-                or ""
-            )
-
-            file_id = response_detail.get("id") or response_detail.get("file_id", "")
-            new_folder_id = response_detail.get("parentFolder", "")
-            folder_code = response_detail.get("parentFolderCode", "")
-
-            guest_token = response_detail.get("guestToken", "")
-
-            if guest_token and guest_account is None:
-                logger.debug(f"Saving guest token for future uploads: {guest_token}")
-                db_manager.save_guest_account(guest_token)
-                client.account_token = guest_token
-            if (
-                new_folder_id
-                and args.category
-                and not folder_id
-                and not new_category_folder_created
-            ):
-                logger.debug(
-                    f"Saving folder information for category '{args.category}'"
-                )
-                folder_info = {
-                    "folder_id": new_folder_id,
-                    "folder_code": folder_code,
-                    "category": args.category,
-                    "created_at": datetime.now().isoformat(),
-                }
-                db_manager.save_folder_for_category(args.category, folder_info)
-
-                # Reuse folder for subsequent files in batch
-                folder_id = new_folder_id
-                new_category_folder_created = True
-                logger.info(
-                    f"Using folder ID {folder_id} for remaining files in category '{args.category}'"
-                )
-                print(f"Created new folder for category '{args.category}'\n")
-
-            if download_link and file_id:
-                file_size = os.path.getsize(file_path)
-                file_name = os.path.basename(file_path)
-                mime_type = (
-                    mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-                )
+    if not files_to_upload:
+        logger.info("No files to upload after filtering.")
+        return
 
-                upload_speed_bps = (
-                    file_size / duration_seconds if duration_seconds > 0 else 0.0
-                )
+    started = time.monotonic()
+    try:
+        results = upload_service.upload_files(
+            files_to_upload, folder_id, args.category, guest_account, args.quiet
+        )
+    except KeyboardInterrupt:
+        logger.warning("Upload cancelled by user")
+        return EXIT_ERROR
 
-                upload_time = datetime.now()
-                expiry_date = upload_time + timedelta(days=DAYS)
-
-                file_info = {
-                    "id": file_id,
-                    "name": file_name,
-                    "size": file_size,
-                    "mime_type": mime_type,
-                    "upload_time": upload_time.isoformat(),
-                    "expiry_date": expiry_date.isoformat(),
-                    "download_link": download_link,
-                    "folder_id": new_folder_id or folder_id,
-                    "folder_code": folder_code,
-                    "category": args.category,
-                    "account_id": guest_account or guest_token,
-                    "upload_speed": upload_speed_bps,
-                    "upload_duration": duration_seconds,
-                }
-
-                db_manager.save_file_info(file_info)
-
-                log_file = os.path.join(
-                    config.get("log_folder"), f"{config.get('log_basename')}_0.log"
-                )
-                with open(log_file, "a") as log:
-                    log_entry = {
-                        "timestamp": datetime.now().isoformat(),
-                        "filename": os.path.basename(file_path),
-                        "filesize": os.path.getsize(file_path),
-                        "filesize_formatted": response_data.get(
-                            "file_size_formatted", ""
-                        ),
-                        "upload_speed": response_data.get("speed_formatted", ""),
-                        "download_link": download_link,
-                        "file_id": file_id,
-                        "folder_id": response_data.get(
-                            "folder_id", response_data.get("parentFolder", "")
-                        ),
-                        "category": args.category,
-                    }
-                    log.write(json.dumps(log_entry) + "\n")
-
-                if not args.quiet:
-                    print()
-                    print(f"┌{'─' * 58}┐")
-                    print(f"│ {'✓ Upload Complete':<56} │")
-                    print(f"├{'─' * 58}┤")
-                    print(f"│ {'File:':<12} {os.path.basename(file_path)[:42]:<43} │")
-                    if args.category:
-                        print(f"│ {'Category:':<12} {args.category[:42]:<43} │")
-                    print(
-                        f"│ {'Size:':<12} {response_data.get('file_size_formatted', ''):<43} │"
-                    )
-                    print(
-                        f"│ {'Speed:':<12} {response_data.get('speed_formatted', ''):<43} │"
-                    )
-                    print(
-                        f"│ {'Expires:':<12} {expiry_date.strftime('%Y-%m-%d'):<43} │"
-                    )
-                    print(f"├{'─' * 58}┤")
-                    print(f"│ {BLUE}{download_link:<56}{END} │")
-                    print(f"└{'─' * 58}┘")
-            else:
-                logger.warning(
-                    f"Upload of {file_path} received incomplete data from server"
-                )
-                print(
-                    f"Warning: Upload may not have completed successfully for {os.path.basename(file_path)}"
-                )
+    print_batch_summary(results, time.monotonic() - started)
 
-        except KeyboardInterrupt:
-            logger.warning(f"Upload of {file_path} cancelled by user")
-            return EXIT_ERROR
-        except HTTPError as e:
-            if e.response.status_code == 500:
-                logger.error(f"Error uploading {file_path}")
-                logger.warning("This 500 error can be caused by:")
-                if folder_id:
-                    logger.warning(
-                        f"  1. The folder '{folder_id}' no longer exists on GoFile"
-                    )
-                    logger.warning(
-                        "     Try uploading without a category, or use -rm to remove the category"
-                    )
-                if guest_account:
-                    logger.warning(
-                        "  2. Your stored guest account token may be invalid/expired"
-                    )
-                    logger.warning(
-                        "     Try: python gofile-uploader.py --reset-account"
-                    )
-                if not folder_id and not guest_account:
-                    logger.warning(
-                        "  - GoFile servers may be experiencing issues. Try again later."
-                    )
-                return EXIT_ERROR
-            logger.error(f"Error uploading {file_path}", exc_info=True)
-        except Exception as e:
-            logger.error(f"Error uploading {file_path}", exc_info=True)
-            logger.error(f"{e}")
-            print(f"Error uploading: {str(e)}")
+    # Failed uploads were already reported by the upload service
+    if sum(result["success"] for result in results) < len(files_to_upload):
+        return EXIT_ERROR
 
 
 if __name__ == "__main__":
@@ -61,38 +61,30 @@ class CategoryService:
             folder_code = category["folder_code"]
 
             if folder_code:
-                folder_link = f"{BLUE}https://gofile.io/d/{folder_code}{END}"
+                folder_url = f"https://gofile.io/d/{folder_code}"
+                folder_link = f"{BLUE}{folder_url}{END}"
             else:
-                folder_link = "<No folder link>"
+                folder_url = folder_link = "<No folder link>"
 
-            entry_width = max(len(name), len(folder_link) - len(BLUE) - len(END)) + 4
+            entry_width = max(len(name), len(folder_url)) + 4
             max_width = max(max_width, entry_width)
 
-            formatted_entries.append((name, folder_link))
+            # Keep the visible link length so padding ignores the color codes
+            formatted_entries.append((name, folder_link, len(folder_url)))
 
         num_cols = max(1, term_width // max_width)
         num_rows = (len(formatted_entries) + num_cols - 1) // num_cols
 
         for row in range(num_rows):
-            name_line = ""
-            for col in range(num_cols):
-                idx = col * num_rows + row
-                if idx < len(formatted_entries):
-                    name = formatted_entries[idx][0]
-                    name_line += f"{name:{max_width}}"
-            print(name_line)
-
-            url_line = ""
-            for col in range(num_cols):
-                idx = col * num_rows + row
-                if idx < len(formatted_entries):
-                    url = formatted_entries[idx][1]
-                    raw_length = (
-                        len(url) - len(BLUE) - len(END) if BLUE in url else len(url)
-                    )
-                    padding = max_width - raw_length
-                    url_line += url + " " * padding
-            print(url_line)
+            # Entries are laid out column-major, so a row is every num_rows-th entry
+            row_entries = formatted_entries[row::num_rows]
+            print("".join(f"{name:<{max_width}}" for name, _, _ in row_entries))
+            print(
+                "".join(
+                    link + " " * (max_width - link_width)
+                    for _, link, link_width in row_entries
+                )
+            )
 
     def remove_category(
         self, category_name: str, deletion_service, force: bool = False
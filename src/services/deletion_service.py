@@ -7,11 +7,15 @@ Consolidates deletion logic to eliminate code duplication.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Set
 from requests.exceptions import HTTPError
 
 from ..gofile_client import GoFileClient
 from ..db_manager import DatabaseManager
+from ..config import config
 from ..utils import (
     print_info,
     print_warning,
@@ -39,6 +43,18 @@ class DeletionService:
             db_manager: Database manager instance
         """
         self.db_manager = db_manager
+        # One client per account token, so deletions reuse pooled connections
+        self._clients: Dict[str, GoFileClient] = {}
+        self._clients_lock = threading.Lock()
+        # IDs the server reported as missing, so they aren't requested again
+        self._known_missing: Set[str] = set()
+
+    def close(self) -> None:
+        """Close all cached GoFile clients."""
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
 
     def delete_file(
         self, file_id_or_name: str, force: bool = False, auto_confirm: bool = False
@@ -61,6 +77,22 @@ class DeletionService:
             # File not found (find_file already printed an error message)
             return False
 
+        return self._delete_file_with_info(file_info, force, auto_confirm)
+
+    def _delete_file_with_info(
+        self, file_info: Dict[str, Any], force: bool = False, auto_confirm: bool = False
+    ) -> bool:
+        """
+        Delete an already located file from GoFile server and local database.
+
+        Args:
+            file_info: File info as returned by find_file or build_file_info
+            force: If True, only delete from local database without attempting remote deletion
+            auto_confirm: If True, skip user confirmation prompts
+
+        Returns:
+            bool: True if deletion was successful, False otherwise
+        """
         # Display file info
         print_warning(file_info["info_str"])
 
@@ -93,7 +125,8 @@ class DeletionService:
 
             if not account_id:
                 logger.error(
-                    f"No account token found for file '{name}'. Cannot delete from GoFile server."
+                    "No account token found for file '%s'. Cannot delete from GoFile server.",
+                    name,
                 )
                 print("Use -f/--force to delete just the local database entry.")
                 return False
@@ -103,7 +136,7 @@ class DeletionService:
                 # Now delete from local database
                 if self._delete_local(actual_id, name):
                     logger.info(
-                        f"File '{name}' successfully deleted from local database."
+                        "File '%s' successfully deleted from local database.", name
                     )
                     return True
                 else:
@@ -115,14 +148,21 @@ class DeletionService:
                 return False
 
     def delete_file_batch(
-        self, files: List[Dict[str, Any]], force: bool = False
+        self, files: List[Dict[str, Any]], force: bool = False, verbose: bool = False
     ) -> tuple[int, int]:
         """
         Delete multiple files with auto-confirmation.
 
+        Remote deletions are network-bound and run concurrently on a thread
+        pool. Local database deletions stay on the calling thread, since the
+        SQLite connection must not be shared between threads. The cached
+        clients stay open for further batches; callers close them when done.
+
         Args:
             files: List of file dictionaries to delete
             force: If True, only delete from local database
+            verbose: If True, print a line for every deleted file; callers
+                otherwise report the returned counts
 
         Returns:
             tuple: (deleted_count, failed_count)
@@ -130,20 +170,70 @@ class DeletionService:
         deleted_count = 0
         failed_count = 0
 
-        for file in files:
-            file_id = file["id"]
-            try:
-                result = self.delete_file(file_id, force, auto_confirm=True)
-                if result:
-                    deleted_count += 1
+        if not files:
+            return deleted_count, failed_count
+
+        if force:
+            deleted_count = self._delete_local_bulk(files, verbose)
+            return deleted_count, len(files) - deleted_count
+
+        remote_deleted_files = []
+        max_workers = max(1, min(config.get("delete_workers", 16), len(files)))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+        pending = set()
+        try:
+            futures = {
+                executor.submit(self._delete_remote_file, file): file for file in files
+            }
+            pending = set(futures)
+
+            for future in as_completed(futures):
+                pending.discard(future)
+                if self._remote_deletion_succeeded(future, futures[future]):
+                    remote_deleted_files.append(futures[future])
                 else:
                     failed_count += 1
-            except Exception as e:
-                logger.error(f"Error deleting file {file_id}: {str(e)}")
-                failed_count += 1
+        except KeyboardInterrupt:
+            # Don't start queued deletions, but wait for the ones already sent
+            # so the records of files gone from GoFile are still removed below
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in pending:
+                if not future.cancelled() and self._remote_deletion_succeeded(
+                    future, futures[future]
+                ):
+                    remote_deleted_files.append(futures[future])
+            raise
+        finally:
+            executor.shutdown()
+            # Remove all remotely deleted records in one transaction
+            deleted_count = self._delete_local_bulk(remote_deleted_files, verbose)
+
+        if deleted_count < len(remote_deleted_files):
+            logger.error(
+                "Some files were deleted from GoFile server but could not be removed from local database."
+            )
+            failed_count += len(remote_deleted_files) - deleted_count
 
         return deleted_count, failed_count
 
+    def _remote_deletion_succeeded(self, future, file: Dict[str, Any]) -> bool:
+        """
+        Get the outcome of a finished remote deletion.
+
+        Args:
+            future: Completed future returned by _delete_remote_file
+            file: File dictionary the future belongs to
+
+        Returns:
+            bool: True if the file was deleted from GoFile, False otherwise
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error("Error deleting file %s: %s", file["id"], e)
+            return False
+
     def delete_category_files(self, category_name: str, force: bool = False) -> bool:
         """
         Delete all files associated with a specific category.
@@ -176,7 +266,10 @@ class DeletionService:
             "Deleting", file_count, "files from category '" + category_name + "'"
         )
 
-        deleted_count, failed_count = self.delete_file_batch(files, force)
+        try:
+            deleted_count, failed_count = self.delete_file_batch(files, force)
+        finally:
+            self.close()
 
         print_file_count_summary(deleted_count, failed_count, "deleted")
         return deleted_count > 0
@@ -191,15 +284,7 @@ class DeletionService:
         Returns:
             bool: True if any files were deleted, False otherwise
         """
-        # Get all files and check which ones have orphaned categories
-        all_files = self.db_manager.get_all_files()
-        categories = set(self.db_manager.list_categories())
-
-        orphaned_files = [
-            file
-            for file in all_files
-            if file["category"] and file["category"] not in categories
-        ]
+        orphaned_files = self.db_manager.get_orphaned_files()
 
         if not orphaned_files:
             print_info("No orphaned files found.")
@@ -227,36 +312,77 @@ class DeletionService:
         # Process files grouped by category
         print_operation_header("Deleting", len(orphaned_files), "orphaned files")
 
-        # Group files by category for better output organization
-        files_by_category = {}
-        for file in orphaned_files:
-            category = file["category"]
-            if category not in files_by_category:
-                files_by_category[category] = []
-            files_by_category[category].append(file)
-
         total_deleted = 0
         total_failed = 0
 
-        # Process each category
-        for category, files in files_by_category.items():
-            print_operation_header(
-                "Processing", len(files), f"files from orphaned category '{category}'"
-            )
+        # Process each category; orphaned files come sorted by category. The
+        # clients are shared across categories and closed once at the end
+        try:
+            for category, group in groupby(orphaned_files, key=lambda f: f["category"]):
+                files = list(group)
+                print_operation_header(
+                    "Processing",
+                    len(files),
+                    f"files from orphaned category '{category}'",
+                )
 
-            deleted_count, failed_count = self.delete_file_batch(files, force)
+                deleted_count, failed_count = self.delete_file_batch(files, force)
 
-            print_info(
-                f"Completed: {deleted_count} deleted, {failed_count} failed for category '{category}'"
-            )
+                print_info(
+                    f"Completed: {deleted_count} deleted, {failed_count} failed for category '{category}'"
+                )
 
-            total_deleted += deleted_count
-            total_failed += failed_count
+                total_deleted += deleted_count
+                total_failed += failed_count
+        finally:
+            self.close()
 
         # Print summary
         print_file_count_summary(total_deleted, total_failed, "removed")
         return total_deleted > 0
 
+    def _delete_remote_file(self, file: Dict[str, Any]) -> bool:
+        """
+        Delete a file record's content from GoFile server.
+
+        Only uses the data already present in the record and never touches
+        the database, so it is safe to run on a worker thread.
+
+        Args:
+            file: File dictionary as returned by the database manager
+
+        Returns:
+            bool: True if remote deletion was successful, False otherwise
+        """
+        account_id = file.get("account_id", "")
+        if not account_id:
+            logger.error(
+                "No account token found for file '%s'. Cannot delete from GoFile server.",
+                file["name"],
+            )
+            return False
+
+        return self._delete_remote(
+            file["id"], file["name"], account_id, file.get("download_link", "")
+        )
+
+    def _get_client(self, account_token: str) -> GoFileClient:
+        """
+        Get the cached GoFile client for an account token, creating it if needed.
+
+        Args:
+            account_token: The account token for authentication
+
+        Returns:
+            GoFileClient: Client bound to the account token
+        """
+        with self._clients_lock:
+            client = self._clients.get(account_token)
+            if client is None:
+                client = GoFileClient(account_token=account_token)
+                self._clients[account_token] = client
+            return client
+
     def _delete_remote(
         self,
         file_id: str,
@@ -276,49 +402,112 @@ class DeletionService:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
+        treat_missing_as_deleted = config.get("treat_missing_as_deleted", False)
+        if file_id in self._known_missing:
+            logger.info(
+                "File '%s' is already known to be missing from GoFile server.",
+                file_name,
+            )
+            return treat_missing_as_deleted
+
         try:
-            # Initialize GoFile client with the account token
-            client = GoFileClient(account_token=account_token)
+            # Reuse the GoFile client for this account token
+            client = self._get_client(account_token)
 
             # Try to delete file from GoFile server
             remote_delete_success = client.delete_contents(file_id)
 
             if remote_delete_success:
                 logger.info(
-                    f"File '{file_name}' successfully deleted from GoFile server."
+                    "File '%s' successfully deleted from GoFile server.", file_name
                 )
                 return True
             else:
-                logger.error(f"Failed to delete file '{file_name}' from GoFile server.")
+                logger.error(
+                    "Failed to delete file '%s' from GoFile server.", file_name
+                )
                 if download_link:
                     logger.error(
-                        f"You may need to check its status manually via your browser at: {download_link}"
+                        "You may need to check its status manually via your browser at: %s",
+                        download_link,
                     )
                 return False
 
         except HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self._known_missing.add(file_id)
+                if treat_missing_as_deleted:
+                    logger.warning(
+                        "File '%s' no longer exists on GoFile server; treating it as deleted.",
+                        file_name,
+                    )
+                    return True
+
             logger.error(
-                f"HTTP error deleting file '{file_name}' from GoFile server: {str(e)}"
+                "HTTP error deleting file '%s' from GoFile server: %s", file_name, e
             )
             if e.response is not None:
                 logger.error(
-                    f"Status Code: {e.response.status_code}. Message: {e.response.text}"
+                    "Status Code: %s. Message: %s",
+                    e.response.status_code,
+                    e.response.text,
                 )
             if download_link:
                 logger.error(
-                    f"This may be because the file doesn't exist on the server.\nPlease check its status or via your browser: {download_link}"
+                    "This may be because the file doesn't exist on the server.\nPlease check its status or via your browser: %s",
+                    download_link,
                 )
             return False
         except Exception as e:
             logger.error(
-                f"Unexpected error deleting file '{file_name}' from GoFile server: {str(e)}"
+                "Unexpected error deleting file '%s' from GoFile server: %s",
+                file_name,
+                e,
             )
             if download_link:
                 logger.error(
-                    f"You may need to check its status manually via your browser at: {download_link}"
+                    "You may need to check its status manually via your browser at: %s",
+                    download_link,
                 )
             return False
 
+    def _delete_local_bulk(
+        self, files: List[Dict[str, Any]], verbose: bool = False
+    ) -> int:
+        """
+        Delete multiple files from the local database in one transaction.
+
+        Args:
+            files: List of file dictionaries to delete
+            verbose: If True, report every deleted file instead of a total
+
+        Returns:
+            int: Number of files deleted
+        """
+        if not files:
+            return 0
+
+        deleted_count = self.db_manager.delete_files_bulk(
+            [file["id"] for file in files]
+        )
+        if deleted_count == len(files):
+            if verbose:
+                for file in files:
+                    logger.info("File '%s' deleted from local database.", file["name"])
+                    print_success(f"File '{file['name']}' deleted successfully.")
+            else:
+                logger.debug("%s files deleted from local database.", deleted_count)
+        else:
+            logger.error(
+                "Only %s of %s files were deleted from local database.",
+                deleted_count,
+                len(files),
+            )
+            print_error(
+                f"Only {deleted_count} of {len(files)} files were deleted from local database."
+            )
+        return deleted_count
+
     def _delete_local(self, file_id: str, file_name: str) -> bool:
         """
         Delete a file from the local database only.
@@ -331,10 +520,10 @@ class DeletionService:
             bool: True if deletion was successful, False otherwise
         """
         if self.db_manager.delete_file(file_id):
-            logger.info(f"File '{file_name}' deleted from local database.")
+            logger.info("File '%s' deleted from local database.", file_name)
             print_success(f"File '{file_name}' deleted successfully.")
             return True
         else:
-            logger.error(f"Failed to delete file '{file_name}' from local database.")
+            logger.error("Failed to delete file '%s' from local database.", file_name)
             print_error(f"Failed to delete file '{file_name}' from local database.")
             return False
@@ -6,19 +6,25 @@ Handles file upload workflow for the GoFile uploader.
 """
 
 import os
-import json
+import atexit
 import glob
 import logging
-import mimetypes
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
 from requests.exceptions import HTTPError
+from tqdm import tqdm
 
 from ..gofile_client import GoFileClient
 from ..db_manager import DatabaseManager
 from ..config import config
 from ..utils import (
-    is_mpegts_file,
+    detect_mpegts_files,
+    get_mime_type,
+    iter_file_entries,
+    to_json_line,
     confirm_action,
     print_info,
     print_warning,
@@ -30,6 +36,30 @@ from ..utils import (
 logger = logging.getLogger("gofile_uploader")
 
 
+class FileJob(NamedTuple):
+    """A file queued for upload, with the metadata gathered while preparing it."""
+
+    path: str
+    size: int
+    mime_type: str
+
+
+def make_file_job(file_path: str, size: Optional[int] = None) -> FileJob:
+    """
+    Build a FileJob for a path.
+
+    Args:
+        file_path: Path to the file
+        size: File size in bytes if already known, otherwise it is looked up
+
+    Returns:
+        FileJob for the file
+    """
+    if size is None:
+        size = os.stat(file_path).st_size
+    return FileJob(file_path, size, get_mime_type(file_path))
+
+
 class UploadService:
     """Service for handling file upload operations."""
 
@@ -43,10 +73,13 @@ class UploadService:
         """
         self.db_manager = db_manager
         self.client = client
+        # Upload log file descriptor, opened on first use and closed at exit
+        self._log_fd: Optional[int] = None
+        self._log_close_registered = False
 
     def prepare_files(
         self, file_patterns: List[str], recursive: bool = False
-    ) -> List[str]:
+    ) -> List[FileJob]:
         """
         Prepare files for upload by expanding globs and processing directories.
 
@@ -55,20 +88,18 @@ class UploadService:
             recursive: If True, recursively process directories
 
         Returns:
-            List of file paths ready for upload
+            List of FileJob entries ready for upload
         """
         # Expand any glob patterns in the file list
         expanded_files = []
         for pattern in file_patterns:
             # Check if the pattern contains any glob special characters
-            if any(char in pattern for char in ["*", "?", "["]):
+            if glob.has_magic(pattern):
                 # Escape special characters to treat them literally
                 safe_pattern = glob.escape(pattern)
                 matched_files = glob.glob(safe_pattern)
                 if not matched_files:
-                    print_warning(
-                        f"Warning: No files found matching pattern: {pattern}"
-                    )
+                    print_warning(f"No files found matching pattern: {pattern}")
                     continue
                 expanded_files.extend(matched_files)
             else:
@@ -76,21 +107,31 @@ class UploadService:
                 if os.path.exists(pattern):
                     expanded_files.append(pattern)
                 else:
-                    print_warning(f"Warning: File not found: {pattern}")
+                    print_warning(f"File not found: {pattern}")
 
         if not expanded_files:
             return []
 
-        # Process directories based on recursive flag
+        # Process directories based on recursive flag, skipping paths matched
+        # by more than one pattern
         final_files = []
-        for file_path in expanded_files:
+        seen = set()
+        for file_path in dict.fromkeys(expanded_files):
             if os.path.isdir(file_path):
                 if recursive:
                     # Recursively gather all files from the directory
-                    logger.info(f"Recursively processing directory: {file_path}")
-                    for root, _, files in os.walk(file_path):
-                        for filename in files:
-                            final_files.append(os.path.join(root, filename))
+                    logger.info("Recursively processing directory: %s", file_path)
+                    for entry in iter_file_entries(file_path):
+                        if entry.path in seen:
+                            continue
+                        seen.add(entry.path)
+                        try:
+                            size = entry.stat().st_size
+                        except OSError as e:
+                            # Reported like any other failed upload
+                            self._log_upload_error(entry.path, e)
+                            continue
+                        final_files.append(make_file_job(entry.path, size))
                     print_info(
                         f"Added {len(final_files)} files from directory {file_path}"
                     )
@@ -98,28 +139,32 @@ class UploadService:
                     print_info(
                         f"No files found in directory {file_path} (use -r flag to upload directories recursively)"
                     )
-            else:
-                final_files.append(file_path)
+            elif file_path not in seen:
+                seen.add(file_path)
+                try:
+                    final_files.append(make_file_job(file_path))
+                except OSError as e:
+                    self._log_upload_error(file_path, e)
 
         return final_files
 
-    def check_mpegts_files(self, files: List[str]) -> List[str]:
+    def check_mpegts_files(self, files: List[FileJob]) -> List[FileJob]:
         """
         Check for MPEG-TS files and ask user for confirmation.
 
         Args:
-            files: List of file paths to check
+            files: List of files to check
 
         Returns:
             List of files to upload (with MPEG-TS files removed if user declined)
         """
-        skipped_files = []
-        for file_path in files:
-            # Check if file is MPEG-TS format
-            if is_mpegts_file(file_path):
-                print_warning(
-                    f"'{os.path.basename(file_path)}' appears to be an MPEG-TS (.ts) file."
-                )
+        skipped_files = set()
+        mpegts = detect_mpegts_files(job.path for job in files)
+        for job in files:
+            file_path = job.path
+            if mpegts.get(file_path):
+                file_name = os.path.basename(file_path)
+                print_warning(f"'{file_name}' appears to be an MPEG-TS (.ts) file.")
                 print_warning(
                     "These files may not play correctly in browsers when shared via GoFile."
                 )
@@ -127,10 +172,10 @@ class UploadService:
                     "Do you still want to upload this file? (yes/no):",
                     require_yes=False,
                 ):
-                    print_info(f"Skipping '{os.path.basename(file_path)}'")
-                    skipped_files.append(file_path)
+                    print_info(f"Skipping '{file_name}'")
+                    skipped_files.add(job)
                     logger.info(
-                        f"Skipping MPEG-TS file: {file_path} based on user request"
+                        "Skipping MPEG-TS file: %s based on user request", file_path
                     )
 
         # Remove skipped files from the list
@@ -158,55 +203,311 @@ class UploadService:
             Dictionary with upload result information
         """
         try:
-            # Record start time for duration calculation
-            start_time = datetime.now()
+            job = make_file_job(file_path)
+        except OSError as e:
+            self._log_upload_error(file_path, e)
+            raise
+
+        return self._upload_job(job, folder_id, category, guest_account, quiet)
 
-            # Upload the file to the specified folder (if any)
-            logger.debug(f"Uploading {file_path} to folder: {folder_id if folder_id else 'root'}")
-            response_data = self.client.upload_file(file_path, folder_id=folder_id)
+    def _upload_job(
+        self,
+        job: FileJob,
+        folder_id: Optional[str],
+        category: Optional[str],
+        guest_account: Optional[str],
+        quiet: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Upload a prepared file and process the response.
 
-            # Calculate upload duration
-            duration_seconds = (datetime.now() - start_time).total_seconds()
+        Args:
+            job: File to upload
+            folder_id: Optional folder ID to upload to
+            category: Optional category name
+            guest_account: Optional guest account token
+            quiet: If True, suppress console output
 
-            # Process the upload response
-            upload_info = self._process_upload_response(
+        Returns:
+            Dictionary with upload result information
+        """
+        try:
+            response_data, duration_seconds = self._upload_remote(job, folder_id)
+            return self._finish_upload(
                 response_data,
-                file_path,
+                job,
                 duration_seconds,
                 category,
                 guest_account,
+                quiet,
+            )
+        except KeyboardInterrupt:
+            logger.warning("Upload of %s cancelled by user", job.path)
+            raise
+        except Exception as e:
+            self._log_upload_error(job.path, e)
+            raise
+
+    def upload_files(
+        self,
+        files: List[FileJob],
+        folder_id: Optional[str],
+        category: Optional[str],
+        guest_account: Optional[str],
+        quiet: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload multiple files, running the network transfers concurrently.
+
+        Files are uploaded one at a time until the guest account and the
+        category folder are known, since the first upload creates them. The
+        remaining files are then uploaded on a thread pool, while responses
+        are processed and saved on the calling thread. The client's account
+        token is therefore final before any worker starts.
+
+        On Ctrl-C, queued uploads are cancelled and the ones in progress are
+        waited for and saved, since they complete on the server regardless.
+
+        Args:
+            files: List of files to upload, as returned by prepare_files
+            folder_id: Optional folder ID to upload to
+            category: Optional category name
+            guest_account: Optional guest account token
+            quiet: If True, suppress console output
+
+        Returns:
+            List of upload result dictionaries for the files that were uploaded
+        """
+        results = []
+        remaining = list(files)
+
+        # Upload serially until the account and folder have been created
+        while remaining and (guest_account is None or (category and not folder_id)):
+            job = remaining.pop(0)
+            try:
+                upload_info = self._upload_job(
+                    job, folder_id, category, guest_account, quiet
+                )
+            except KeyboardInterrupt:
+                raise
+            except Exception:
+                # Error already logged in _upload_job
+                continue
+
+            results.append(upload_info)
+            guest_account, folder_id = self._apply_upload_result(
+                upload_info, folder_id, category, guest_account
             )
 
-            # Save to database and log
-            if upload_info["success"]:
-                self._save_upload_info(upload_info, category, guest_account)
+        if not remaining:
+            return results
+
+        max_workers = max(1, min(config.get("upload_workers", 4), len(remaining)))
+
+        # Each running upload draws its progress bar on its own terminal line
+        positions = queue.SimpleQueue()
+        for position in range(max_workers):
+            positions.put(position)
 
-                # Print information to the console
-                if not quiet:
-                    self._print_upload_summary(upload_info, category)
+        def upload(job: FileJob) -> Tuple[Dict[str, Any], float]:
+            position = positions.get()
+            try:
+                return self._upload_remote(job, folder_id, position)
+            finally:
+                positions.put(position)
 
-            return upload_info
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+        pending = set()
+        try:
+            futures = {executor.submit(upload, job): job for job in remaining}
+            pending = set(futures)
 
+            for future in as_completed(futures):
+                pending.discard(future)
+                upload_info = self._collect_upload(
+                    future, futures[future], category, guest_account, quiet
+                )
+                if upload_info is not None:
+                    results.append(upload_info)
         except KeyboardInterrupt:
-            logger.warning(f"Upload of {file_path} cancelled by user")
-            raise
-        except HTTPError as e:
-            if e.response.status_code == 500:
-                logger.error(f"Error uploading {file_path}")
-                print(
-                    "Note: This often happens when the folder doesn't exist or got deleted."
+            running = [future for future in pending if future.running()]
+            if running:
+                print_info(
+                    f"Waiting for {len(running)} upload(s) in progress to finish..."
                 )
-                print(
+            # Don't start queued uploads; the running ones finish on the server
+            # anyway, so wait for them and save their records
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in pending:
+                if not future.cancelled():
+                    self._collect_upload(
+                        future, futures[future], category, guest_account, quiet
+                    )
+            raise
+        finally:
+            executor.shutdown()
+
+        return results
+
+    def _collect_upload(
+        self,
+        future: Future,
+        job: FileJob,
+        category: Optional[str],
+        guest_account: Optional[str],
+        quiet: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Save the result of a finished upload from the worker pool.
+
+        Args:
+            future: Completed future returned by _upload_remote
+            job: The file the future uploaded
+            category: Optional category name
+            guest_account: Optional guest account token
+            quiet: If True, suppress console output
+
+        Returns:
+            Dictionary with upload result information, or None if it failed
+        """
+        try:
+            response_data, duration_seconds = future.result()
+            return self._finish_upload(
+                response_data, job, duration_seconds, category, guest_account, quiet
+            )
+        except Exception as e:
+            self._log_upload_error(job.path, e)
+            return None
+
+    def _apply_upload_result(
+        self,
+        upload_info: Dict[str, Any],
+        folder_id: Optional[str],
+        category: Optional[str],
+        guest_account: Optional[str],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Store the guest account and category folder created by an upload.
+
+        Args:
+            upload_info: Processed upload information
+            folder_id: Current folder ID (None for new categories)
+            category: Optional category name
+            guest_account: Current guest account token
+
+        Returns:
+            Tuple of the guest account token and folder ID to use from now on
+        """
+        # Save guest account if we got a new token
+        if upload_info["guest_token"] and guest_account is None:
+            self.save_guest_account(upload_info["guest_token"])
+            guest_account = upload_info["guest_token"]
+
+        # Handle category folder mapping for new categories
+        if category and not folder_id:
+            folder_id = self.handle_category_folder(
+                category,
+                folder_id,
+                upload_info["folder_id"],
+                upload_info["folder_code"],
+            )
+
+        return guest_account, folder_id
+
+    def _upload_remote(
+        self, job: FileJob, folder_id: Optional[str], position: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        Upload a file to GoFile without touching the database.
+
+        This only does network work, so it is safe to run on a worker thread.
+
+        Args:
+            job: File to upload
+            folder_id: Optional folder ID to upload to
+            position: Terminal line for the progress bar on a worker thread
+
+        Returns:
+            Tuple of the API response and the upload duration in seconds
+        """
+        # Record start time for duration calculation
+        start_time = time.monotonic()
+
+        # Upload the file to the specified folder (if any)
+        logger.debug("Uploading %s to folder: %s", job.path, folder_id or "root")
+        response_data = self.client.upload_file(
+            job.path, folder_id=folder_id, file_size=job.size, position=position
+        )
+
+        # Calculate upload duration
+        duration_seconds = time.monotonic() - start_time
+        return response_data, duration_seconds
+
+    def _finish_upload(
+        self,
+        response_data: Dict[str, Any],
+        job: FileJob,
+        duration_seconds: float,
+        category: Optional[str],
+        guest_account: Optional[str],
+        quiet: bool,
+    ) -> Dict[str, Any]:
+        """
+        Process an upload response, save it and print the summary.
+
+        Args:
+            response_data: Response from GoFile API
+            job: The uploaded file
+            duration_seconds: Upload duration in seconds
+            category: Optional category name
+            guest_account: Optional guest account token
+            quiet: If True, suppress console output
+
+        Returns:
+            Dictionary with upload result information
+        """
+        # Process the upload response
+        upload_info = self._process_upload_response(
+            response_data,
+            job,
+            duration_seconds,
+            datetime.now(),
+            category,
+            guest_account,
+        )
+
+        # Save to database and log
+        if upload_info["success"]:
+            self._save_upload_info(upload_info, category, guest_account)
+
+            # Print information to the console
+            if not quiet:
+                self._print_upload_summary(upload_info, category)
+
+        return upload_info
+
+    def _log_upload_error(self, file_path: str, error: Exception) -> None:
+        """
+        Log a failed upload.
+
+        Args:
+            file_path: Path to the file that failed to upload
+            error: The exception raised by the upload
+        """
+        if isinstance(error, HTTPError):
+            if error.response is not None and error.response.status_code == 500:
+                logger.error("Error uploading %s", file_path)
+                tqdm.write(
+                    "Note: This often happens when the folder doesn't exist or got deleted.\n"
                     "      Please check the folder link in a browser and try again. (get folder link with -l)"
                 )
             else:
-                logger.error(f"Error uploading {file_path}", exc_info=True)
-            raise
-        except Exception as e:
-            logger.error(f"Error uploading {file_path}", exc_info=True)
-            logger.error(f"{e}")
-            print(f"Error uploading: {str(e)}")
-            raise
+                logger.error("Error uploading %s", file_path, exc_info=error)
+        else:
+            logger.error("Error uploading %s", file_path, exc_info=error)
+            logger.error("%s", error)
+            tqdm.write(f"Error uploading: {str(error)}")
 
     def handle_category_folder(
         self,
@@ -229,7 +530,7 @@ class UploadService:
         """
         # If this is a new category and we have a folder ID, save the mapping
         if new_folder_id and category and not folder_id:
-            logger.debug(f"Saving folder information for category '{category}'")
+            logger.debug("Saving folder information for category '%s'", category)
             folder_info = {
                 "folder_id": new_folder_id,
                 "folder_code": folder_code,
@@ -239,7 +540,9 @@ class UploadService:
             self.db_manager.save_folder_for_category(category, folder_info)
 
             logger.info(
-                f"Using folder ID {new_folder_id} for remaining files in category '{category}'"
+                "Using folder ID %s for remaining files in category '%s'",
+                new_folder_id,
+                category,
             )
             print(f"Created new folder for category '{category}'\n")
 
@@ -254,7 +557,7 @@ class UploadService:
         Args:
             guest_token: Guest account token from upload response
         """
-        logger.debug(f"Saving guest token for future uploads: {guest_token}")
+        logger.debug("Saving guest token for future uploads: %s", guest_token)
         self.db_manager.save_guest_account(guest_token)
         # Update the client with the new token
         self.client.account_token = guest_token
@@ -262,8 +565,9 @@ class UploadService:
     def _process_upload_response(
         self,
         response_data: Dict[str, Any],
-        file_path: str,
+        job: FileJob,
         duration_seconds: float,
+        upload_time: datetime,
         category: Optional[str],
         guest_account: Optional[str],
     ) -> Dict[str, Any]:
@@ -272,8 +576,9 @@ class UploadService:
 
         Args:
             response_data: Response from GoFile API
-            file_path: Path to the uploaded file
+            job: The uploaded file
             duration_seconds: Upload duration in seconds
+            upload_time: Time the upload finished
             category: Optional category name
             guest_account: Optional guest account token
 
@@ -281,13 +586,17 @@ class UploadService:
             Dictionary with processed upload information
         """
         # Extract data from the nested 'data' object if present
+        file_path = job.path
+        file_name = os.path.basename(file_path)
+
         if "data" in response_data and isinstance(response_data["data"], dict):
             response_detail = response_data["data"]
         else:
             response_detail = response_data
 
         # Log the full response for debugging
-        logger.debug(f"Full response: {response_data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full response: %s", response_data)
 
         # Extract download link
         download_link = (
@@ -311,19 +620,17 @@ class UploadService:
 
         if not success:
             logger.warning(
-                f"Upload of {file_path} received incomplete data from server"
+                "Upload of %s received incomplete data from server", file_path
             )
             print(
-                f"Warning: Upload may not have completed successfully for {os.path.basename(file_path)}"
+                f"Warning: Upload may not have completed successfully for {file_name}"
             )
 
-        # Calculate file information
-        file_size = os.path.getsize(file_path)
-        file_name = os.path.basename(file_path)
-        mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        # File size and MIME type were gathered when the file was prepared
+        file_size = job.size
+        mime_type = job.mime_type
         upload_speed_bps = file_size / duration_seconds if duration_seconds > 0 else 0.0
 
-        upload_time = datetime.now()
         expiry_date = upload_time + timedelta(days=DAYS)
 
         return {
@@ -378,24 +685,58 @@ class UploadService:
         self.db_manager.save_file_info(file_info)
 
         # Add entry to log file
+        log_entry = {
+            "timestamp": upload_info["upload_time"].isoformat(),
+            "filename": upload_info["file_name"],
+            "filesize": upload_info["file_size"],
+            "filesize_formatted": upload_info["response_data"].get(
+                "file_size_formatted", ""
+            ),
+            "upload_speed": upload_info["response_data"].get("speed_formatted", ""),
+            "download_link": upload_info["download_link"],
+            "file_id": upload_info["file_id"],
+            "folder_id": upload_info["folder_id"],
+            "category": category,
+        }
+        self._append_log(to_json_line(log_entry))
+
+    def _append_log(self, line: str) -> None:
+        """
+        Append a line to the upload log.
+
+        The log is kept open in append mode and each line is written with a
+        single os.write, which appends atomically even while other writers
+        (such as the logging handler) use the same file. The logging handler
+        rotates this file, so it is reopened whenever the path no longer
+        points at the open file.
+
+        Args:
+            line: Text to append, including the trailing newline
+        """
         log_file = os.path.join(
             config.get("log_folder"), f"{config.get('log_basename')}_0.log"
         )
-        with open(log_file, "a") as log:
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "filename": upload_info["file_name"],
-                "filesize": upload_info["file_size"],
-                "filesize_formatted": upload_info["response_data"].get(
-                    "file_size_formatted", ""
-                ),
-                "upload_speed": upload_info["response_data"].get("speed_formatted", ""),
-                "download_link": upload_info["download_link"],
-                "file_id": upload_info["file_id"],
-                "folder_id": upload_info["folder_id"],
-                "category": category,
-            }
-            log.write(json.dumps(log_entry) + "\n")
+        if self._log_fd is not None:
+            try:
+                rotated = os.fstat(self._log_fd).st_ino != os.stat(log_file).st_ino
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self._close_log()
+        if self._log_fd is None:
+            if not self._log_close_registered:
+                atexit.register(self._close_log)
+                self._log_close_registered = True
+            self._log_fd = os.open(
+                log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        os.write(self._log_fd, line.encode("utf-8"))
+
+    def _close_log(self) -> None:
+        """Close the upload log if it is open."""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
 
     def _print_upload_summary(
         self, upload_info: Dict[str, Any], category: Optional[str]
@@ -407,13 +748,27 @@ class UploadService:
             upload_info: Processed upload information
             category: Optional category name
         """
-        print(f"\nFile: {upload_info['file_name']}")
+        response_data = upload_info["response_data"]
+        lines = [
+            "",
+            f"┌{'─' * 58}┐",
+            f"│ {'✓ Upload Complete':<56} │",
+            f"├{'─' * 58}┤",
+            f"│ {'File:':<12} {upload_info['file_name'][:42]:<43} │",
+        ]
         if category:
-            print(f"Category: {category}")
-        print(f"Size: {upload_info['response_data'].get('file_size_formatted', '')}")
-        print(
-            f"Upload speed: {upload_info['response_data'].get('speed_formatted', '')}"
+            lines.append(f"│ {'Category:':<12} {category[:42]:<43} │")
+        lines.append(
+            f"│ {'Size:':<12} {response_data.get('file_size_formatted', ''):<43} │"
+        )
+        lines.append(
+            f"│ {'Speed:':<12} {response_data.get('speed_formatted', ''):<43} │"
+        )
+        lines.append(
+            f"│ {'Expires:':<12} {upload_info['expiry_date'].strftime('%Y-%m-%d'):<43} │"
         )
-        print(f"Download link: {BLUE}{upload_info['download_link']}{END}")
-        print(f"Expires on: {upload_info['expiry_date'].strftime('%Y-%m-%d')}")
-        print("-" * 50)
+        lines.append(f"├{'─' * 58}┤")
+        lines.append(f"│ {BLUE}{upload_info['download_link']:<56}{END} │")
+        lines.append(f"└{'─' * 58}┘")
+        # Written through tqdm so it doesn't tear the bars of running uploads
+        tqdm.write("\n".join(lines))
@@ -4,19 +4,101 @@ Utility functions for the GoFile uploader.
 """
 
 import os
+import bisect
+import json
+import mimetypes
+import re
 import shutil
 import subprocess
+import sys
 import logging
 import wcwidth
-from typing import Callable, Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple, Union
 from tqdm import tqdm
 
+from .config import config
+
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 DAYS = 10  # gofile default expiry
 BLUE = "\033[94m"
 END = "\033[0m"
 
+# ANSI color codes such as BLUE and END; they take up no space on screen
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# (divisor, unit) pairs for format_size and format_speed, one per 10 bits
+_SIZE_UNITS = (
+    (1, "B"),
+    (1 << 10, "KB"),
+    (1 << 20, "MB"),
+    (1 << 30, "GB"),
+    (1 << 40, "TB"),
+)
+_MAX_UNIT_INDEX = len(_SIZE_UNITS) - 1
+
+# File extensions used for MPEG transport streams; only these are probed
+MPEGTS_EXTENSIONS = (".ts", ".m2ts", ".mts")
+# Number of leading packets whose sync byte must match
+MPEGTS_SNIFF_PACKETS = 4
+
+# ffprobe executable, resolved once; None when it is not installed
+_FFPROBE = shutil.which("ffprobe")
+
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+# Common media types, checked before the system MIME database. Some systems
+# map .ts to Qt translation files and .mts to 3D models, or lack .mkv
+_MEDIA_TYPES = {
+    ".mp4": "video/mp4",
+    ".m4v": "video/mp4",
+    ".mkv": "video/x-matroska",
+    ".webm": "video/webm",
+    ".mov": "video/quicktime",
+    ".avi": "video/x-msvideo",
+    ".ts": "video/mp2t",
+    ".m2ts": "video/mp2t",
+    ".mts": "video/mp2t",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".opus": "audio/ogg",
+    ".wav": "audio/x-wav",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# Shared tqdm settings for upload progress bars. disable=None turns the bar
+# off when stderr is not a terminal, e.g. under cron or with redirected output.
+# miniters=0 stops tqdm from tuning its own update count, so redraws are
+# throttled by mininterval alone
+UPLOAD_BAR_KWARGS = {
+    "unit": "B",
+    "unit_scale": True,
+    "unit_divisor": 1024,
+    "miniters": 0,
+    "mininterval": 0.2,
+    "maxinterval": 1.0,
+    "smoothing": 0.1,
+    "dynamic_ncols": True,
+    "disable": None,
+    "bar_format": "{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]{postfix}",
+}
+
+# Load the MIME type database once up front instead of on the first lookup
+mimetypes.init()
+
 
 def format_time(seconds: float) -> str:
     """
@@ -28,15 +110,32 @@ def format_time(seconds: float) -> str:
     Returns:
         Human-readable time string
     """
-    hours, remainder = divmod(int(seconds), 3600)
-    minutes, seconds = divmod(remainder, 60)
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
 
-    if hours > 0:
-        return f"{hours}h {minutes}m {seconds}s"
-    elif minutes > 0:
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
         return f"{minutes}m {seconds}s"
-    else:
-        return f"{seconds}s"
+
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m {seconds}s"
+
+
+def _unit_index(value: Union[int, float]) -> int:
+    """
+    Get the index into _SIZE_UNITS for a value.
+
+    Each unit covers ten more bits, so the index follows from the bit length
+    of the integer part instead of a chain of comparisons.
+
+    Args:
+        value: Non-negative size or speed in bytes
+
+    Returns:
+        Index of the largest unit not exceeding the value
+    """
+    return min(max(0, (int(value).bit_length() - 1) // 10), _MAX_UNIT_INDEX)
 
 
 def format_size(size_bytes: Union[int, float]) -> str:
@@ -47,16 +146,13 @@ def format_size(size_bytes: Union[int, float]) -> str:
         size_bytes: Size in bytes
 
     Returns:
-        Human-readable string with appropriate unit (B, KB, MB, GB)
+        Human-readable string with appropriate unit (B, KB, MB, GB, TB)
     """
-    if size_bytes < 1024:
+    index = _unit_index(size_bytes)
+    if index == 0:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    divisor, unit = _SIZE_UNITS[index]
+    return f"{size_bytes / divisor:.2f} {unit}"
 
 
 def format_speed(bytes_per_second: float) -> str:
@@ -67,31 +163,213 @@ def format_speed(bytes_per_second: float) -> str:
         bytes_per_second: Speed in bytes per second
 
     Returns:
-        Human-readable string with appropriate unit (B/s, KB/s, MB/s, GB/s)
-    """
-    if bytes_per_second < 1024:
-        return f"{bytes_per_second:.2f} B/s"
-    elif bytes_per_second < 1024 * 1024:
-        return f"{bytes_per_second / 1024:.2f} KB/s"
-    elif bytes_per_second < 1024 * 1024 * 1024:
-        return f"{bytes_per_second / (1024 * 1024):.2f} MB/s"
-    else:
-        return f"{bytes_per_second / (1024 * 1024 * 1024):.2f} GB/s"
+        Human-readable string with appropriate unit (B/s, KB/s, MB/s, GB/s, TB/s)
+    """
+    divisor, unit = _SIZE_UNITS[_unit_index(bytes_per_second)]
+    return f"{bytes_per_second / divisor:.2f} {unit}/s"
+
+
+def aggregate_stats(sizes: Iterable[int], elapsed: float) -> Tuple[int, float]:
+    """
+    Combine the sizes of a batch of uploads with the time the batch took.
+
+    Uploads run in parallel, so the batch time is the wall-clock time of the
+    whole batch rather than the sum of the per-file durations.
+
+    Args:
+        sizes: Bytes uploaded per file
+        elapsed: Wall-clock seconds spent uploading the batch
+
+    Returns:
+        Tuple of (total bytes, average speed in bytes per second)
+    """
+    total_bytes = sum(sizes)
+    speed = total_bytes / elapsed if elapsed > 0 else 0.0
+    return total_bytes, speed
+
+
+def to_json_line(obj) -> str:
+    """
+    Serialize an object to a single JSON line, including the newline.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        The JSON text followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(obj) + "\n"
+
+
+def get_mime_type(file_path: str) -> str:
+    """
+    Guess the MIME type of a file from its name.
+
+    Args:
+        file_path: Path or name of the file
+
+    Returns:
+        The MIME type, or application/octet-stream if it is unknown
+    """
+    # Same result as os.path.splitext for the extension, without its overhead;
+    # the dot must come after the last separator and not start the name
+    dot = file_path.rfind(".")
+    sep = max(file_path.rfind(os.sep), file_path.rfind("/"))
+    ext = file_path[dot:].lower() if dot > sep + 1 else ""
+    if ext in mimetypes.encodings_map:
+        # Compressed names like .tar.gz take their type from the inner suffix
+        return mimetypes.guess_type(file_path)[0] or DEFAULT_MIME_TYPE
+    return _mime_for_ext(ext)
+
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """Look up the MIME type for a lower-case file extension."""
+    media_type = _MEDIA_TYPES.get(ext)
+    if media_type:
+        return media_type
+    return mimetypes.guess_type("x" + ext)[0] or DEFAULT_MIME_TYPE
+
+
+def iter_file_entries(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the directory entries of all files below a directory.
+
+    Uses os.scandir directly, so file types come from the cached directory
+    entries instead of a stat() per path. Entries are yielded in the same
+    order as os.walk, and symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        os.DirEntry of each file found
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    elif not entry.is_dir():
+                        yield entry
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {current}: {e}")
+            continue
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def iter_files(directory: str) -> Iterator[str]:
+    """
+    Recursively yield the paths of all files below a directory.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Path of each file found
+    """
+    for entry in iter_file_entries(directory):
+        yield entry.path
+
+
+def detect_mpegts_files(file_paths: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check which of several files are in MPEG-TS format.
+
+    Only files with a transport stream extension are examined; others are
+    left out of the result. Several candidates are checked on a thread pool,
+    since the work is file reads or ffprobe processes that release the GIL.
+
+    Args:
+        file_paths: Paths to check
+
+    Returns:
+        Dict mapping each candidate path to whether it is MPEG-TS, in input order
+    """
+    candidates = [
+        path for path in file_paths if path.lower().endswith(MPEGTS_EXTENSIONS)
+    ]
+    if len(candidates) <= 1:
+        return {path: is_mpegts_file(path) for path in candidates}
+
+    workers = min(len(candidates), 32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(candidates, executor.map(is_mpegts_file, candidates)))
 
 
 def is_mpegts_file(file_path: str) -> bool:
+    """
+    Check if a file is in MPEG-TS format.
+
+    Reads the first few packets and looks for the 0x47 sync byte that starts
+    every transport stream packet. Set ``mpegts_ffprobe`` in the config to
+    ask ffprobe instead; the header check is still used when ffprobe is not
+    installed.
+
+    Args:
+        file_path: Path to the file to check
+
+    Returns:
+        bool: True if the file is in MPEG-TS format, False otherwise or if it can't be read
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return False
+    if _FFPROBE and config.get("mpegts_ffprobe", False):
+        return _probe_mpegts(file_path, st.st_mtime_ns, st.st_size)
+    return _sniff_mpegts(file_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _sniff_mpegts(file_path: str, mtime_ns: int, size: int) -> bool:
+    """
+    Look for transport stream sync bytes in the file header.
+
+    Plain .ts files use 188-byte packets; M2TS files prefix each packet with
+    a 4-byte timestamp. mtime_ns and size are only part of the cache key.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(MPEGTS_SNIFF_PACKETS * 192)
+    except OSError:
+        return False
+    for offset, stride in ((0, 188), (4, 192)):
+        if len(header) >= offset + (MPEGTS_SNIFF_PACKETS - 1) * stride + 1 and all(
+            header[offset + i * stride] == 0x47 for i in range(MPEGTS_SNIFF_PACKETS)
+        ):
+            return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _probe_mpegts(file_path: str, mtime_ns: int, size: int) -> bool:
     """
     Check if a file is in MPEG-TS format using ffprobe.
 
+    Results are cached like _sniff_mpegts, so rescanning an unchanged file
+    does not start another process.
+
     Args:
         file_path: Path to the file to check
+        mtime_ns: Modification time, only part of the cache key
+        size: File size, only part of the cache key
 
     Returns:
-        bool: True if the file is in MPEG-TS format, False otherwise or if ffprobe fails
+        bool: True if ffprobe reports MPEG-TS, False otherwise or if ffprobe fails
     """
     try:
         cmd = [
-            "ffprobe",
+            _FFPROBE,
             "-v",
             "error",
             "-show_entries",
@@ -101,72 +379,53 @@ def is_mpegts_file(file_path: str) -> bool:
             file_path,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+        )
 
         if result.returncode != 0:
             return False
 
-        output = result.stdout.strip()
-        return "mpegts" in output.lower() or "mpeg-ts" in output.lower()
+        output = result.stdout.casefold()
+        return "mpegts" in output or "mpeg-ts" in output
 
     except Exception:
         return False
 
 
-class ProgressFileReader:
-    """
-    A file reader that tracks progress and reports it to a callback function.
-    """
-
-    def __init__(self, file_obj, callback: Callable[[int], None]):
-        """
-        Initialize a progress file reader.
-
-        Args:
-            file_obj: The file object to read from
-            callback: A callback function that takes the number of bytes read
-        """
-        self.file_obj = file_obj
-        self.callback = callback
-        self.bytes_read = 0
-
-    def read(self, size=-1):
-        """
-        Read from the file and report progress.
-
-        Args:
-            size: Number of bytes to read
-
-        Returns:
-            The bytes read
-        """
-        chunk = self.file_obj.read(size)
-        self.bytes_read += len(chunk)
-        self.callback(len(chunk))
-        return chunk
-
-
-def create_progress_bar(file_path: str, desc: str = "") -> tqdm:
+def create_progress_bar(
+    file_path: str,
+    desc: str = "",
+    file_size: Optional[int] = None,
+    position: Optional[int] = None,
+) -> tqdm:
     """
     Create a progress bar for a file upload.
 
     Args:
         file_path: Path to the file
         desc: Description for the progress bar
+        file_size: File size in bytes if already known, to skip the stat call
+        position: Terminal line for the bar when several uploads run at once;
+            such bars are removed when they finish
 
     Returns:
         A tqdm progress bar
     """
-    file_size = os.path.getsize(file_path)
-    file_name = os.path.basename(file_path) if not desc else desc
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
+    file_name = desc or os.path.basename(file_path)
 
     return tqdm(
         total=file_size,
-        unit="B",
-        unit_scale=True,
-        unit_divisor=1024,
         desc=f"↑ {file_name}",
-        bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+        position=position,
+        leave=position is None,
+        **UPLOAD_BAR_KWARGS,
     )
 
 
@@ -184,7 +443,8 @@ def resolve_category(db_manager, category_input: str) -> Optional[str]:
         Resolved full category name, the original name (for new categories),
         or None if unable to resolve
     """
-    all_categories = sorted(db_manager.list_categories())
+    # Already sorted: SQLite's binary collation orders UTF-8 like Python strings
+    all_categories = db_manager.list_categories()
 
     if not all_categories:
         logger.info(
@@ -202,7 +462,14 @@ def resolve_category(db_manager, category_input: str) -> Optional[str]:
             logger.error("Please provide a partial category name before the * wildcard")
             return None
 
-        matches = [cat for cat in all_categories if cat.startswith(partial_category)]
+        # Prefix matches form one contiguous run in the sorted list
+        lo = bisect.bisect_left(all_categories, partial_category)
+        hi = lo
+        while hi < len(all_categories) and all_categories[hi].startswith(
+            partial_category
+        ):
+            hi += 1
+        matches = all_categories[lo:hi]
 
         if len(matches) == 0:
             logger.warning(f"No categories found starting with '{partial_category}'")
@@ -251,14 +518,8 @@ def resolve_category(db_manager, category_input: str) -> Optional[str]:
             )
             return None
     else:
-        # Not using wildcard - check for exact match first
-        exact_match = next(
-            (cat for cat in all_categories if cat == category_input), None
-        )
-        if exact_match:
-            return exact_match
-
-        # No exact match and no wildcard - treat as new category name
+        # Without a wildcard the name is used as-is, whether it is an
+        # existing category or a new one
         return category_input
 
 
@@ -272,7 +533,37 @@ def get_visual_width(text) -> int:
     Returns:
         int: The visual width of the text
     """
-    return wcwidth.wcswidth(str(text))
+    text = str(text)
+    # Printable ASCII is one column per character; skip the wcwidth tables
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return _cached_wcswidth(text)
+
+
+@lru_cache(maxsize=4096)
+def _cached_wcswidth(text: str) -> int:
+    """
+    Measure text with wcwidth, caching the result.
+
+    Tables repeat the same headers, sizes and category names, and wcswidth
+    looks up every character in Python.
+    """
+    return wcwidth.wcswidth(text)
+
+
+def _visible_width(text: str) -> int:
+    """
+    Calculate the visual width of text, ignoring ANSI color codes.
+
+    Args:
+        text: The string to measure
+
+    Returns:
+        int: The visual width of the text
+    """
+    if "\x1b" in text:
+        text = _ANSI_RE.sub("", text)
+    return get_visual_width(text)
 
 
 def pad_string(text, width, align="left") -> str:
@@ -301,6 +592,27 @@ def pad_string(text, width, align="left") -> str:
         return text_str + " " * padding_needed
 
 
+def _truncate_to_width(text: str, max_width: int) -> str:
+    """
+    Shorten text with a trailing '...' so it fits within a visual width.
+
+    Args:
+        text: The string to shorten
+        max_width: Maximum visual width including the '...'
+
+    Returns:
+        The longest prefix of text that fits, followed by '...'
+    """
+    # Add up character widths once and cut at the first that overflows
+    limit = max_width - 3
+    width = 0
+    for i, char in enumerate(text):
+        width += max(0, wcwidth.wcwidth(char))
+        if width > limit:
+            return text[:i] + "..."
+    return text + "..."
+
+
 def print_dynamic_table(data, headers, max_filename_length=None) -> None:
     """
     Print a dynamically sized table based on content length.
@@ -311,63 +623,107 @@ def print_dynamic_table(data, headers, max_filename_length=None) -> None:
         headers: Dictionary mapping column keys to header names
         max_filename_length: Maximum length for filename column (None for no limit)
     """
-    display_data = data.copy()
+    display_data = data
 
     if max_filename_length is not None and "name" in headers:
-        for row in display_data:
-            if (
-                "name" in row
-                and get_visual_width(str(row["name"])) > max_filename_length
-            ):
+        # Copy only the rows whose name is shortened; the caller's rows stay as-is
+        display_data = []
+        for row in data:
+            if "name" in row:
                 name = str(row["name"])
-                truncated = ""
-                for char in name:
-                    if (
-                        get_visual_width(truncated + char + "...")
-                        <= max_filename_length
-                    ):
-                        truncated += char
-                    else:
-                        break
-                row["name"] = truncated + "..."
+                if get_visual_width(name) > max_filename_length:
+                    row = {**row, "name": _truncate_to_width(name, max_filename_length)}
+            display_data.append(row)
+
+    columns = list(headers)
+
+    # Stringify and measure every cell once, for both the widths and the padding
+    rendered = [[str(row.get(col, "")) for col in columns] for row in display_data]
+    widths = [list(map(get_visual_width, cells)) for cells in rendered]
+
+    # Transpose the header and cell widths so each column is one max() call
+    header_widths = [get_visual_width(headers[col]) for col in columns]
+    col_widths = [max(column) + 2 for column in zip(header_widths, *widths)]
+
+    total_width = sum(col_widths) + len(columns) - 1
+
+    # Build the whole table first so it reaches the terminal in one write
+    lines = [
+        f"\n{'=' * total_width}",
+        " ".join(
+            pad_string(headers[col], col_width)
+            for col, col_width in zip(columns, col_widths)
+        ),
+        "-" * total_width,
+    ]
+    for cells, cell_widths in zip(rendered, widths):
+        lines.append(
+            " ".join(
+                cell + " " * (col_width - width)
+                for cell, width, col_width in zip(cells, cell_widths, col_widths)
+            )
+        )
+    lines.append(f"{'=' * total_width}\n")
 
-    col_widths = {col: get_visual_width(header) + 2 for col, header in headers.items()}
+    print("\n".join(lines))
 
-    for row in display_data:
-        for col in headers.keys():
-            value = str(row.get(col, ""))
-            col_widths[col] = max(col_widths[col], get_visual_width(value) + 2)
 
-    total_width = sum(col_widths.values()) + len(headers) - 1
+def print_separator(char: str = "=", width: int = 50) -> None:
+    """
+    Print a separator line.
 
-    print(f"\n{'=' * total_width}")
+    Args:
+        char: Character to use for the separator
+        width: Width of the separator line
+    """
+    print(char * width)
 
-    header_cells = []
-    for col in headers.keys():
-        header_cells.append(pad_string(headers[col], col_widths[col]))
-    print(" ".join(header_cells))
 
-    print(f"{'-' * total_width}")
+# Prefixes for the fixed-label message helpers below
+_WARNING_PREFIX = "[WARNING] "
+_ERROR_PREFIX = "[ERROR] "
+_SUCCESS_PREFIX = "[SUCCESS] "
 
-    for row in display_data:
-        row_cells = []
-        for col in headers.keys():
-            value = str(row.get(col, ""))
-            row_cells.append(pad_string(value, col_widths[col]))
-        print(" ".join(row_cells))
 
-    print(f"{'=' * total_width}\n")
+def print_info(message: str, prefix: str = "INFO") -> None:
+    """
+    Print a console message with a bracketed prefix.
 
+    Args:
+        message: The message to print
+        prefix: Label shown in brackets before the message
+    """
+    sys.stdout.write(f"[{prefix}] {message}\n")
 
-def print_separator(char: str = "=", width: int = 50) -> None:
+
+def print_warning(message: str) -> None:
     """
-    Print a separator line.
+    Print a warning message.
 
     Args:
-        char: Character to use for the separator
-        width: Width of the separator line
+        message: The message to print
     """
-    print(char * width)
+    sys.stdout.write(f"{_WARNING_PREFIX}{message}\n")
+
+
+def print_error(message: str) -> None:
+    """
+    Print an error message.
+
+    Args:
+        message: The message to print
+    """
+    sys.stdout.write(f"{_ERROR_PREFIX}{message}\n")
+
+
+def print_success(message: str) -> None:
+    """
+    Print a success message.
+
+    Args:
+        message: The message to print
+    """
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{message}\n")
 
 
 def confirm_action(message: str, require_yes: bool = True) -> bool:
@@ -446,24 +802,20 @@ def print_multi_column_list(
     if all(isinstance(item, str) for item in items):
         items = [(item,) for item in items]
 
-    max_width = 0
-    for item_tuple in items:
-        for item in item_tuple:
-            clean_item = (
-                str(item).replace(BLUE, "").replace(END, "")
-                if isinstance(item, str)
-                else str(item)
-            )
-            max_width = max(max_width, get_visual_width(clean_item))
-
-    max_width += 4
+    # Measure each item once; the widths are reused for the padding below
+    widths = [
+        [_visible_width(str(item)) for item in item_tuple] for item_tuple in items
+    ]
+    max_width = max((width for row in widths for width in row), default=0) + 4
     num_cols = max(1, term_width // max_width)
     num_rows = (len(items) + num_cols - 1) // num_cols
 
+    # Build every line first so the list reaches the terminal in one write
+    lines = []
     if headers:
         header_cells = [pad_string(header, max_width) for header in headers[:num_cols]]
-        print("\n" + " ".join(header_cells))
-        print("-" * (max_width * min(num_cols, len(headers))))
+        lines.append("\n" + " ".join(header_cells))
+        lines.append("-" * (max_width * min(num_cols, len(headers))))
 
     for row in range(num_rows):
         row_cells = []
@@ -471,12 +823,13 @@ def print_multi_column_list(
         for col in range(num_cols):
             idx = col * num_rows + row
             if idx < len(items):
-                item = items[idx][0]
-                row_cells.append(pad_string(str(item), max_width))
+                item = str(items[idx][0])
+                row_cells.append(item + " " * (max_width - widths[idx][0]))
 
-        print("".join(row_cells))
+        lines.append("".join(row_cells))
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def print_file_list_summary(
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Pytest configuration and shared fixtures."""
 
+import logging
 import os
 import sys
 import tempfile
@@ -8,9 +9,31 @@ import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.config import config
 from src.db_manager import DatabaseManager
 
 
+@pytest.fixture(autouse=True)
+def isolated_runtime_paths(tmp_path_factory, monkeypatch):
+    """Point the configured log folder and database at a temporary directory."""
+    runtime_dir = tmp_path_factory.mktemp("runtime")
+    (runtime_dir / "logs").mkdir()
+    monkeypatch.setitem(config._config, "log_folder", str(runtime_dir / "logs"))
+    monkeypatch.setitem(
+        config._config, "database_path", str(runtime_dir / "db" / "gofile.db")
+    )
+
+    # main() replaces the root logger's handlers with ones writing to the
+    # log folder; put the originals back so later tests don't log there
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield runtime_dir
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers, root.level = handlers, level
+
+
 @pytest.fixture
 def temp_db_path():
     """Create a temporary database file path."""
@@ -29,6 +52,26 @@ def temp_db(temp_db_path):
     db.close()
 
 
+@pytest.fixture
+def add_file(temp_db):
+    """Return a helper that inserts a minimal file record into temp_db."""
+
+    def _add_file(file_id, name=None, category="Docs", account_id="token123"):
+        temp_db.save_file_info(
+            {
+                "id": file_id,
+                "name": name or f"{file_id}.txt",
+                "size": 10,
+                "download_link": f"https://gofile.io/d/{file_id}",
+                "folder_id": "folder1",
+                "category": category,
+                "account_id": account_id,
+            }
+        )
+
+    return _add_file
+
+
 @pytest.fixture
 def temp_file():
     """Create a temporary file for upload testing."""
@@ -3,12 +3,15 @@
 
 import os
 import sys
+import threading
 import pytest
 from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.gofile_uploader import main
+from src.gofile_uploader import main, purge_category_files
+from src.config import config
+from src.db_manager import DatabaseManager
 from src import __version__
 
 
@@ -60,6 +63,78 @@ class TestListCategories:
         assert "TestCategory" in captured.out
 
 
+class TestPurgeCategoryFiles:
+    """Tests for purge_category_files."""
+
+    def test_remote_deletes_run_outside_transaction(self, temp_db, add_file):
+        """Should only hold the write lock for the local bulk delete."""
+        temp_db.save_folder_for_category("Docs", {"folder_id": "folder1"})
+        for file_id in ("a", "b", "c"):
+            add_file(file_id)
+        in_transaction = []
+
+        def fake_delete(file_id):
+            in_transaction.append(temp_db.conn.in_transaction)
+            return file_id != "b"
+
+        client = MagicMock()
+        client.delete_contents.side_effect = fake_delete
+        with patch("src.services.deletion_service.GoFileClient", return_value=client):
+            with patch("src.gofile_uploader.confirm_action", return_value=True):
+                assert purge_category_files(temp_db, "Docs")
+
+        assert in_transaction == [False, False, False]
+        assert [f["id"] for f in temp_db.get_all_files()] == ["b"]
+
+
+class TestUploadFiles:
+    """Tests for uploading files from the command line."""
+
+    def test_uploads_run_concurrently(self, tmp_path, capsys):
+        """Should upload several files at once through the upload pool."""
+        files = []
+        for i in range(3):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text("content")
+            files.append(str(path))
+        config.ensure_database_initialized()
+        db = DatabaseManager(config.get("database_path"))
+        db.save_guest_account("guest123")
+        db.close()
+
+        # Every upload must be running before any of them can finish
+        started = threading.Barrier(3)
+
+        def upload(file_path, folder_id=None, file_size=None, position=None):
+            started.wait(timeout=5)
+            name = os.path.basename(file_path)
+            return {
+                "data": {
+                    "downloadPage": f"https://gofile.io/d/{name}",
+                    "id": name,
+                    "parentFolder": "folder1",
+                }
+            }
+
+        client = MagicMock()
+        client.upload_file.side_effect = upload
+        with patch("src.gofile_uploader.GoFileClient", return_value=client):
+            with patch.object(sys, "argv", ["gofile-uploader", "-q", *files]):
+                result = main()
+
+        assert result is None
+        assert "Uploaded 3 files" in capsys.readouterr().out
+        db = DatabaseManager(config.get("database_path"))
+        try:
+            assert sorted(f["id"] for f in db.get_all_files()) == [
+                "file0.txt",
+                "file1.txt",
+                "file2.txt",
+            ]
+        finally:
+            db.close()
+
+
 class TestNoArguments:
     """Tests for running without arguments."""
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the database manager."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestConnection:
+    """Tests for the database connection settings."""
+
+    def test_uses_wal_journal(self, temp_db):
+        """Should open the database in WAL mode."""
+        mode = temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+
+class TestIndexes:
+    """Tests for DatabaseManager.ensure_indexes."""
+
+    def test_creates_lookup_indexes(self, temp_db):
+        """Should create the category and name indexes on the files table."""
+        cursor = temp_db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'files'"
+        )
+        names = {row[0] for row in cursor.fetchall()}
+
+        assert {"idx_files_category", "idx_files_name"} <= names
+
+
+class TestOrphanedFiles:
+    """Tests for DatabaseManager.get_orphaned_files."""
+
+    def test_returns_files_without_category(self, temp_db, add_file):
+        """Should return only files whose category no longer exists."""
+        temp_db.save_folder_for_category("Docs", {"folder_id": "folder1"})
+        add_file("kept", category="Docs")
+        add_file("orphan", category="Gone")
+        add_file("uncategorized", category="")
+
+        assert [f["id"] for f in temp_db.get_orphaned_files()] == ["orphan"]
+
+    def test_orders_by_category(self, temp_db, add_file):
+        """Should return orphaned files grouped by category."""
+        for file_id, category in (("a", "Zed"), ("b", "Alpha"), ("c", "Zed")):
+            add_file(file_id, category=category)
+
+        categories = [f["category"] for f in temp_db.get_orphaned_files()]
+
+        assert categories == ["Alpha", "Zed", "Zed"]
+
+
+class TestDeleteFilesBulk:
+    """Tests for DatabaseManager.delete_files_bulk."""
+
+    def test_deletes_across_chunks(self, temp_db, add_file):
+        """Should delete every listed file, even beyond one statement's chunk."""
+        ids = [f"file{i}" for i in range(1200)]
+        for file_id in ids:
+            add_file(file_id)
+        add_file("other")
+
+        assert temp_db.delete_files_bulk(ids) == 1200
+        assert [f["id"] for f in temp_db.get_all_files()] == ["other"]
+
+    def test_empty_list(self, temp_db):
+        """Should do nothing for an empty list."""
+        assert temp_db.delete_files_bulk([]) == 0
+
+
+class TestTransactions:
+    """Tests for explicit DatabaseManager transactions."""
+
+    def test_rollback_discards_deferred_writes(self, temp_db, add_file):
+        """Should defer per-row commits until the transaction ends."""
+        add_file("a")
+        add_file("b")
+
+        temp_db.begin_transaction()
+        assert temp_db.delete_file("a")
+        temp_db.rollback()
+
+        assert temp_db.get_file_count() == 2
+
+    def test_commit_applies_deferred_writes(self, temp_db, add_file):
+        """Should write all deletions made inside the transaction on commit."""
+        add_file("a")
+        add_file("b")
+
+        temp_db.begin_transaction()
+        temp_db.delete_file("a")
+        assert temp_db.delete_files_bulk(["b"]) == 1
+        temp_db.commit()
+
+        assert temp_db.get_file_count() == 0
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for the deletion service."""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.exceptions import HTTPError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import DeletionService
+
+
+class TestDeleteFileBatch:
+    """Tests for DeletionService.delete_file_batch."""
+
+    def test_force_deletes_locally_only(self, temp_db, add_file):
+        """Should remove records without contacting GoFile when forced."""
+        for file_id in ("a", "b", "c"):
+            add_file(file_id)
+        service = DeletionService(temp_db)
+
+        with patch.object(DeletionService, "_delete_remote") as mock_remote:
+            result = service.delete_file_batch(temp_db.get_all_files(), force=True)
+
+        assert result == (3, 0)
+        mock_remote.assert_not_called()
+        assert temp_db.get_file_count() == 0
+
+    def test_keeps_records_when_remote_deletion_fails(self, temp_db, add_file):
+        """Should only remove records that were deleted remotely."""
+        for file_id in ("a", "b", "c", "d"):
+            add_file(file_id)
+        service = DeletionService(temp_db)
+
+        def fake_remote(file_id, file_name, account_token, download_link=""):
+            return file_id != "b"
+
+        with patch.object(service, "_delete_remote", side_effect=fake_remote):
+            result = service.delete_file_batch(temp_db.get_all_files())
+
+        assert result == (3, 1)
+        assert [f["id"] for f in temp_db.get_all_files()] == ["b"]
+
+    def test_interrupt_keeps_database_in_sync(self, temp_db, add_file):
+        """Should still remove records of files deleted before Ctrl-C."""
+        for file_id in ("a", "b", "c"):
+            add_file(file_id)
+        service = DeletionService(temp_db)
+
+        def fake_remote(file_id, file_name, account_token, download_link=""):
+            if file_id == "b":
+                raise KeyboardInterrupt
+            return True
+
+        with patch.object(service, "_delete_remote", side_effect=fake_remote):
+            with pytest.raises(KeyboardInterrupt):
+                service.delete_file_batch(temp_db.get_all_files())
+
+        remaining = [f["id"] for f in temp_db.get_all_files()]
+        assert "a" not in remaining
+        assert "b" in remaining
+
+    def test_missing_account_token_fails(self, temp_db, add_file):
+        """Should not attempt remote deletion without an account token."""
+        add_file("a", account_id="")
+        service = DeletionService(temp_db)
+
+        with patch.object(service, "_delete_remote") as mock_remote:
+            result = service.delete_file_batch(temp_db.get_all_files())
+
+        assert result == (0, 1)
+        mock_remote.assert_not_called()
+        assert temp_db.get_file_count() == 1
+
+    def test_empty_batch(self, temp_db):
+        """Should handle an empty file list."""
+        assert DeletionService(temp_db).delete_file_batch([]) == (0, 0)
+
+
+class TestClientReuse:
+    """Tests for DeletionService client caching."""
+
+    def test_reuses_client_per_token(self, temp_db):
+        """Should return the same client for the same account token."""
+        service = DeletionService(temp_db)
+
+        first = service._get_client("token123")
+
+        assert service._get_client("token123") is first
+        assert service._get_client("other") is not first
+        service.close()
+        assert service._clients == {}
+
+    def test_orphan_cleanup_keeps_clients_across_categories(self, temp_db, add_file):
+        """Should create one client for all categories and close it at the end."""
+        add_file("a", category="Old1")
+        add_file("b", category="Old2")
+        service = DeletionService(temp_db)
+
+        with patch("src.services.deletion_service.GoFileClient") as mock_client:
+            with patch(
+                "src.services.deletion_service.confirm_action", return_value=True
+            ):
+                assert service.delete_orphaned_files()
+
+        assert mock_client.call_count == 1
+        mock_client.return_value.close.assert_called_once()
+        assert temp_db.get_all_files() == []
+
+
+class TestMissingRemoteFiles:
+    """Tests for files that no longer exist on GoFile."""
+
+    def missing_client(self):
+        """Build a client whose deletions fail with 404."""
+        client = MagicMock()
+        client.delete_contents.side_effect = HTTPError(
+            response=MagicMock(status_code=404, text="not found")
+        )
+        return client
+
+    def test_missing_file_is_not_requested_again(self, temp_db):
+        """Should remember a 404 and skip the next request for that file."""
+        service = DeletionService(temp_db)
+        client = self.missing_client()
+
+        with patch.object(service, "_get_client", return_value=client):
+            assert not service._delete_remote("a", "a.txt", "token123")
+            assert not service._delete_remote("a", "a.txt", "token123")
+
+        assert client.delete_contents.call_count == 1
+
+    def test_missing_file_treated_as_deleted(self, temp_db):
+        """Should report success for a 404 when configured to."""
+        service = DeletionService(temp_db)
+
+        with patch.object(service, "_get_client", return_value=self.missing_client()):
+            with patch("src.services.deletion_service.config") as mock_config:
+                mock_config.get.return_value = True
+                assert service._delete_remote("a", "a.txt", "token123")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Tests for the file manager."""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.file_manager import find_file, build_file_info
+
+
+class TestFindFile:
+    """Tests for find_file."""
+
+    def test_id_lookup_skips_full_scan(self, temp_db, add_file):
+        """Should find a file by ID without loading every file."""
+        add_file("abc")
+
+        with patch.object(temp_db, "get_all_files") as mock_all:
+            file_info = find_file(temp_db, "abc")
+
+        mock_all.assert_not_called()
+        assert file_info == build_file_info(temp_db.get_file_by_id("abc"))
+
+    def test_finds_by_name(self, temp_db, add_file):
+        """Should fall back to matching the file name."""
+        add_file("abc", name="report.pdf")
+
+        file_info = find_file(temp_db, "report.pdf")
+
+        assert file_info["actual_id"] == "abc"
+        assert file_info["info_str"] == "✖ 'report.pdf' (ID: abc) in category 'Docs'"
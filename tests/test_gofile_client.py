@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for the GoFile client."""
+
+import io
+import mmap
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gofile_client import MultipartStream, open_upload_body
+
+
+class TestMultipartStream:
+    """Tests for MultipartStream."""
+
+    def test_body_and_length(self):
+        """Should frame the fields and file and report the exact length."""
+        data = b"hello world" * 1000
+        progress = []
+        stream = MultipartStream(
+            {"token": "abc"},
+            'my "clip".mp4',
+            io.BytesIO(data),
+            len(data),
+            "video/mp4",
+            progress.append,
+        )
+
+        body = b"".join(stream)
+
+        assert len(stream) == len(body)
+        assert b'name="token"\r\n\r\nabc\r\n' in body
+        assert b'filename="my %22clip%22.mp4"' in body
+        assert b"Content-Type: video/mp4\r\n\r\n" + data + b"\r\n--" in body
+        assert progress[-1] == len(data)
+
+    def test_chunks_from_reused_buffer(self):
+        """Should produce the file in order when each chunk is consumed in turn."""
+        data = bytes(range(256)) * 40
+        stream = MultipartStream(
+            {}, "a.bin", io.BytesIO(data), len(data), "text/plain", chunk_size=1000
+        )
+
+        body = b"".join(bytes(chunk) for chunk in stream)
+
+        assert len(body) == len(stream)
+        assert data in body
+
+    def test_chunks_grow_when_sent_quickly(self):
+        """Should read larger chunks while the consumer keeps up."""
+        data = b"x" * 100_000
+        stream = MultipartStream(
+            {}, "a.bin", io.BytesIO(data), len(data), "text/plain", chunk_size=1000
+        )
+
+        sizes = [len(chunk) for chunk in stream][1:-1]
+
+        assert sum(sizes) == len(data)
+        assert sizes[:3] == [1000, 2000, 4000]
+
+    def test_sent_with_content_length(self):
+        """Should be sent as a framed body rather than chunked."""
+        stream = MultipartStream({}, "a.txt", io.BytesIO(b"abc"), 3, "text/plain")
+
+        prepared = requests.Request(
+            "POST", "https://example.com", data=stream
+        ).prepare()
+
+        assert prepared.headers["Content-Length"] == str(len(stream))
+        assert "Transfer-Encoding" not in prepared.headers
+
+    def test_file_shorter_than_expected(self):
+        """Should fail instead of sending a truncated body."""
+        stream = MultipartStream({}, "a.txt", io.BytesIO(b"abc"), 10, "text/plain")
+
+        with pytest.raises(OSError):
+            b"".join(stream)
+
+
+class TestOpenUploadBody:
+    """Tests for open_upload_body."""
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    @pytest.mark.parametrize("data", [b"hello world" * 1000, b""])
+    def test_reads_whole_file(self, tmp_path, data, use_mmap):
+        """Should read the file whether it is mapped or opened plainly."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+
+        with open_upload_body(str(path), len(data), use_mmap=use_mmap) as body:
+            assert body.read() == data
+
+    def test_not_mapped_by_default(self, tmp_path):
+        """Should read through the file object unless mapping is enabled."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"data")
+
+        with open_upload_body(str(path), 4) as body:
+            assert not isinstance(body, mmap.mmap)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Tests for the upload service."""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import UploadService
+
+
+def fake_response(file_path, folder_id=None, file_size=None, position=None):
+    """Build a GoFile upload response for a file."""
+    file_id = os.path.basename(file_path)
+    return {
+        "data": {
+            "id": file_id,
+            "downloadPage": f"https://gofile.io/d/{file_id}",
+            "parentFolder": "folder1",
+            "parentFolderCode": "code1",
+            "guestToken": "guest123",
+        }
+    }
+
+
+class TestPrepareFiles:
+    """Tests for UploadService.prepare_files."""
+
+    def test_collects_size_and_mime_type(self, temp_db, tmp_path):
+        """Should record size and MIME type for files found in directories."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "movie.mp4").write_bytes(b"x" * 42)
+        service = UploadService(temp_db, MagicMock())
+
+        jobs = service.prepare_files([str(tmp_path)], recursive=True)
+
+        assert [(os.path.basename(j.path), j.size, j.mime_type) for j in jobs] == [
+            ("movie.mp4", 42, "video/mp4")
+        ]
+
+    def test_skips_duplicate_paths(self, temp_db, tmp_path):
+        """Should list a file only once when several arguments match it."""
+        path = tmp_path / "a.txt"
+        path.write_text("content")
+        service = UploadService(temp_db, MagicMock())
+
+        jobs = service.prepare_files([str(path), str(tmp_path), str(path)], True)
+
+        assert [j.path for j in jobs] == [str(path)]
+
+    def test_unreadable_file_reported_as_error(self, temp_db, tmp_path, capsys):
+        """Should report unreadable files as upload errors, missing ones once."""
+        (tmp_path / "gone.txt").symlink_to(tmp_path / "missing.txt")
+        service = UploadService(temp_db, MagicMock())
+
+        jobs = service.prepare_files(
+            [str(tmp_path), str(tmp_path / "nope.txt")], recursive=True
+        )
+
+        out = capsys.readouterr().out
+        assert jobs == []
+        assert "Error uploading:" in out
+        assert f"[WARNING] File not found: {tmp_path / 'nope.txt'}" in out
+
+
+class TestUploadFiles:
+    """Tests for UploadService.upload_files."""
+
+    def test_first_upload_creates_account_and_folder(self, temp_db, tmp_path):
+        """Should reuse the account and folder created by the first upload."""
+        files = []
+        for i in range(5):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text("content")
+            files.append(str(path))
+
+        client = MagicMock()
+        client.upload_file.side_effect = fake_response
+        service = UploadService(temp_db, client)
+
+        with patch.object(service, "_append_log"):
+            results = service.upload_files(
+                service.prepare_files(files), None, "Docs", None, quiet=True
+            )
+
+        assert len(results) == 5
+        assert temp_db.get_file_count("Docs") == 5
+        assert temp_db.get_guest_account() == "guest123"
+        assert temp_db.get_folder_by_category("Docs")["folder_id"] == "folder1"
+        # Only the first upload goes without a folder
+        folder_ids = [c.kwargs["folder_id"] for c in client.upload_file.call_args_list]
+        assert folder_ids.count(None) == 1
+
+    def test_failed_upload_is_skipped(self, temp_db, tmp_path):
+        """Should continue with the other files when one upload fails."""
+        files = []
+        for i in range(3):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text("content")
+            files.append(str(path))
+
+        def upload(file_path, folder_id=None, file_size=None, position=None):
+            if file_path.endswith("file1.txt"):
+                raise RuntimeError("connection reset")
+            return fake_response(file_path)
+
+        client = MagicMock()
+        client.upload_file.side_effect = upload
+        temp_db.save_guest_account("guest123")
+        service = UploadService(temp_db, client)
+
+        with patch.object(service, "_append_log"):
+            results = service.upload_files(
+                service.prepare_files(files), None, None, "guest123", quiet=True
+            )
+
+        assert sorted(r["file_id"] for r in results) == ["file0.txt", "file2.txt"]
+
+    def test_interrupt_saves_running_uploads(self, temp_db, tmp_path):
+        """Should record uploads that were already running when Ctrl-C hit."""
+        files = []
+        for i in range(3):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text("content")
+            files.append(str(path))
+
+        # All three uploads are in progress before the interrupt arrives
+        started = threading.Barrier(3)
+
+        def upload(file_path, folder_id=None, file_size=None, position=None):
+            started.wait(timeout=5)
+            if file_path.endswith("file1.txt"):
+                raise KeyboardInterrupt
+            return fake_response(file_path)
+
+        client = MagicMock()
+        client.upload_file.side_effect = upload
+        temp_db.save_guest_account("guest123")
+        service = UploadService(temp_db, client)
+
+        with patch.object(service, "_append_log"):
+            with pytest.raises(KeyboardInterrupt):
+                service.upload_files(
+                    service.prepare_files(files), None, None, "guest123", quiet=True
+                )
+
+        assert sorted(f["id"] for f in temp_db.get_all_files()) == [
+            "file0.txt",
+            "file2.txt",
+        ]
+
+
+class TestUploadLog:
+    """Tests for the upload log writer."""
+
+    def test_appends_lines(self, temp_db, tmp_path):
+        """Should append each line to the log file through one descriptor."""
+        settings = {"log_folder": str(tmp_path), "log_basename": "test"}
+        log_file = tmp_path / "test_0.log"
+        log_file.write_text("existing\n")
+        service = UploadService(temp_db, MagicMock())
+
+        with patch("src.services.upload_service.config") as mock_config:
+            mock_config.get.side_effect = lambda key, default=None: settings[key]
+            service._append_log('{"a": 1}\n')
+            service._append_log('{"b": 2}\n')
+        service._close_log()
+
+        assert log_file.read_text() == 'existing\n{"a": 1}\n{"b": 2}\n'
+
+    def test_reopens_after_rotation(self, temp_db, tmp_path):
+        """Should write to the new log file after the old one is rotated away."""
+        settings = {"log_folder": str(tmp_path), "log_basename": "test"}
+        log_file = tmp_path / "test_0.log"
+        service = UploadService(temp_db, MagicMock())
+
+        with patch("src.services.upload_service.config") as mock_config:
+            mock_config.get.side_effect = lambda key, default=None: settings[key]
+            service._append_log('{"a": 1}\n')
+            log_file.rename(tmp_path / "test_0.log.1")
+            log_file.write_text("")
+            service._append_log('{"b": 2}\n')
+        service._close_log()
+
+        assert (tmp_path / "test_0.log.1").read_text() == '{"a": 1}\n'
+        assert log_file.read_text() == '{"b": 2}\n'
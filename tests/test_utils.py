@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Tests for utility functions."""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import utils
+from src.utils import (
+    BLUE,
+    END,
+    aggregate_stats,
+    detect_mpegts_files,
+    format_size,
+    format_speed,
+    format_time,
+    get_mime_type,
+    get_visual_width,
+    is_mpegts_file,
+    print_dynamic_table,
+    print_multi_column_list,
+    resolve_category,
+    iter_files,
+    to_json_line,
+)
+
+
+class TestFormatSize:
+    """Tests for format_size and format_speed."""
+
+    def test_unit_boundaries(self):
+        """Should switch units at each power of 1024."""
+        assert format_size(0) == "0 B"
+        assert format_size(1023) == "1023 B"
+        assert format_size(1024) == "1.00 KB"
+        assert format_size(1024 * 1024 - 1) == "1024.00 KB"
+        assert format_size(1 << 20) == "1.00 MB"
+        assert format_size(5 * (1 << 30)) == "5.00 GB"
+        assert format_size(3 * (1 << 40)) == "3.00 TB"
+
+    def test_speed(self):
+        """Should format speeds with two decimals in every unit."""
+        assert format_speed(0) == "0.00 B/s"
+        assert format_speed(512.5) == "512.50 B/s"
+        assert format_speed(1536) == "1.50 KB/s"
+        assert format_speed(2.5 * (1 << 20)) == "2.50 MB/s"
+
+
+class TestFormatTime:
+    """Tests for format_time."""
+
+    def test_unit_boundaries(self):
+        """Should add minutes and hours only when needed."""
+        assert format_time(0) == "0s"
+        assert format_time(59.9) == "59s"
+        assert format_time(60) == "1m 0s"
+        assert format_time(3599) == "59m 59s"
+        assert format_time(3600) == "1h 0m 0s"
+        assert format_time(90061) == "25h 1m 1s"
+
+
+class TestAggregateStats:
+    """Tests for aggregate_stats."""
+
+    def test_totals_and_average(self):
+        """Should sum the batch and divide bytes by the elapsed time."""
+        assert aggregate_stats([100, 300], 2.0) == (400, 200.0)
+
+    def test_empty_batch(self):
+        """Should report zero speed without dividing by zero."""
+        assert aggregate_stats([], 0.0) == (0, 0.0)
+
+
+class TestIterFiles:
+    """Tests for iter_files."""
+
+    def test_matches_os_walk(self, tmp_path):
+        """Should yield the same files in the same order as os.walk."""
+        for rel in ("a.txt", "sub/b.txt", "sub/deeper/c.txt", "other/d.txt"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+        expected = [
+            os.path.join(root, name)
+            for root, _, files in os.walk(tmp_path)
+            for name in files
+        ]
+
+        assert list(iter_files(str(tmp_path))) == expected
+
+    def test_missing_directory(self, tmp_path):
+        """Should yield nothing for a directory that can't be read."""
+        assert list(iter_files(str(tmp_path / "missing"))) == []
+
+
+class TestToJsonLine:
+    """Tests for to_json_line."""
+
+    def test_round_trips_with_newline(self):
+        """Should produce one parseable JSON line."""
+        entry = {"filename": "a.txt", "filesize": 10, "category": None}
+
+        line = to_json_line(entry)
+
+        assert line.endswith("\n") and line.count("\n") == 1
+        assert json.loads(line) == entry
+
+    def test_without_orjson(self):
+        """Should fall back to the standard library."""
+        with patch.object(utils, "orjson", None):
+            assert to_json_line({"a": 1}) == '{"a": 1}\n'
+
+
+class TestIsMpegtsFile:
+    """Tests for is_mpegts_file."""
+
+    def test_transport_stream(self, tmp_path):
+        """Should detect 188-byte packets starting with the sync byte."""
+        path = tmp_path / "video.ts"
+        path.write_bytes((b"\x47" + b"\x00" * 187) * 4)
+
+        assert is_mpegts_file(str(path))
+
+    def test_m2ts_stream(self, tmp_path):
+        """Should detect 192-byte packets with a timestamp prefix."""
+        path = tmp_path / "video.m2ts"
+        path.write_bytes((b"\x00" * 4 + b"\x47" + b"\x00" * 187) * 4)
+
+        assert is_mpegts_file(str(path))
+
+    def test_other_content(self, tmp_path):
+        """Should reject files without sync bytes or too short to check."""
+        other = tmp_path / "notes.ts"
+        other.write_bytes(b"x" * 1000)
+        short = tmp_path / "short.ts"
+        short.write_bytes(b"\x47" * 10)
+
+        assert not is_mpegts_file(str(other))
+        assert not is_mpegts_file(str(short))
+        assert not is_mpegts_file(str(tmp_path / "missing.ts"))
+
+    def test_batch_only_checks_candidates(self, tmp_path):
+        """Should report only files with a transport stream extension."""
+        video = tmp_path / "video.TS"
+        video.write_bytes((b"\x47" + b"\x00" * 187) * 4)
+        text = tmp_path / "notes.mts"
+        text.write_bytes(b"x" * 1000)
+        other = tmp_path / "clip.mp4"
+        other.write_bytes((b"\x47" + b"\x00" * 187) * 4)
+
+        result = detect_mpegts_files([str(video), str(other), str(text)])
+
+        assert result == {str(video): True, str(text): False}
+
+    def test_ffprobe_missing_falls_back_to_header(self, tmp_path):
+        """Should check the header without running ffprobe when it is missing."""
+        path = tmp_path / "video.ts"
+        path.write_bytes((b"\x47" + b"\x00" * 187) * 4)
+
+        with patch.object(utils, "_FFPROBE", None):
+            with patch.object(utils.config, "get", return_value=True):
+                with patch("src.utils.subprocess.run") as mock_run:
+                    assert is_mpegts_file(str(path))
+
+        mock_run.assert_not_called()
+
+
+class TestGetMimeType:
+    """Tests for get_mime_type."""
+
+    def test_known_and_unknown_extensions(self):
+        """Should match mimetypes and fall back to octet-stream."""
+        assert get_mime_type("/videos/clip.MP4") == "video/mp4"
+        assert get_mime_type("recording.ts") == "video/mp2t"
+        assert get_mime_type("archive.tar.gz") == "application/x-tar"
+        assert get_mime_type("data.unknownext") == "application/octet-stream"
+        assert get_mime_type("README") == "application/octet-stream"
+        assert get_mime_type("/v1.2/README") == "application/octet-stream"
+        assert get_mime_type("/videos/.mp4") == "application/octet-stream"
+
+
+class TestGetVisualWidth:
+    """Tests for get_visual_width."""
+
+    def test_ascii_and_wide_characters(self):
+        """Should count ASCII as one column and wide characters as two."""
+        assert get_visual_width("report 2024.pdf") == 15
+        assert get_visual_width(12345) == 5
+        assert get_visual_width("日本語.mp4") == 10
+        assert get_visual_width("a\tb") == -1
+
+
+class TestPrintDynamicTable:
+    """Tests for print_dynamic_table."""
+
+    def test_columns_align_with_wide_characters(self, capsys):
+        """Should pad every cell to the widest visual width in its column."""
+        rows = [{"id": 1, "name": "日本語.mp4"}, {"id": 22, "name": "a.txt"}]
+
+        print_dynamic_table(rows, {"id": "ID", "name": "Name"})
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert lines[1] == "ID   Name        "
+        assert lines[3] == "1    日本語.mp4  "
+        assert lines[4] == "22   a.txt       "
+
+    def test_truncates_without_mutating_rows(self, capsys):
+        """Should shorten long names for display only."""
+        rows = [{"id": 1, "name": "a_very_long_file_name.mp4"}]
+
+        print_dynamic_table(rows, {"id": "ID", "name": "Name"}, 10)
+
+        assert "a_very_...  " in capsys.readouterr().out
+        assert rows[0]["name"] == "a_very_long_file_name.mp4"
+
+    def test_truncates_wide_characters_by_width(self, capsys):
+        """Should count wide characters as two columns when shortening."""
+        rows = [{"name": "日本語ファイル名.mp4"}]
+
+        print_dynamic_table(rows, {"name": "Name"}, 9)
+
+        assert "日本語...  " in capsys.readouterr().out
+
+
+class TestPrintMultiColumnList:
+    """Tests for print_multi_column_list."""
+
+    def test_colored_items_align(self, capsys):
+        """Should pad colored items by their visible width."""
+        items = [f"{BLUE}abc{END}", "de", "fghij"]
+
+        print_multi_column_list(items, term_width=9)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == f"{BLUE}abc{END}      "
+        assert lines[1] == "de       "
+        assert lines[2] == "fghij    "
+
+
+class TestResolveCategory:
+    """Tests for resolve_category."""
+
+    def test_wildcard_prefix(self, temp_db):
+        """Should resolve a unique prefix and leave plain names alone."""
+        for name in ("docs", "music", "musicals", "videos"):
+            temp_db.save_folder_for_category(name, {"folder_id": f"id-{name}"})
+
+        assert resolve_category(temp_db, "vid*") == "videos"
+        assert resolve_category(temp_db, "x*") is None
+        assert resolve_category(temp_db, "new") == "new"
+        with patch("builtins.input", return_value="2"):
+            assert resolve_category(temp_db, "music*") == "musicals"
+
+    def test_wildcard_non_ascii(self, temp_db):
+        """Should match prefixes of non-ASCII names in SQLite's sort order."""
+        for name in ("ecole", "éclair", "日本", "日本語", "z\U0010ffff", "zz"):
+            temp_db.save_folder_for_category(name, {"folder_id": f"id-{name}"})
+
+        assert resolve_category(temp_db, "éc*") == "éclair"
+        assert resolve_category(temp_db, "e*") == "ecole"
+        assert resolve_category(temp_db, "日本語*") == "日本語"
+        assert resolve_category(temp_db, "z\U0010ffff*") == "z\U0010ffff"
+        with patch("builtins.input", return_value="1"):
+            assert resolve_category(temp_db, "日*") == "日本"